@@ -0,0 +1,37 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for isinstance() checks against the abstract base classes."""
+
+import mir.monads.abc as monads_abc
+import mir.monads.maybe as maybe
+
+N = 100000
+
+_just = maybe.Just(1)
+
+
+def bench_isinstance_maybe():
+    for _ in range(N):
+        isinstance(_just, maybe.Maybe)
+
+
+def bench_isinstance_monad():
+    for _ in range(N):
+        isinstance(_just, monads_abc.Monad)
+
+
+def bench_isinstance_monad_false():
+    for _ in range(N):
+        isinstance(1, monads_abc.Monad)
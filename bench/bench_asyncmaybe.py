@@ -0,0 +1,52 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for AsyncMaybe fan-out against sequential awaits."""
+
+import asyncio
+
+from mir.monads import asyncmaybe
+
+N = 20
+DELAY = 0.01
+
+
+@asyncmaybe.monadic
+async def _lookup(key):
+    await asyncio.sleep(DELAY)
+    return key
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def _collect(*values):
+    return values
+
+
+def bench_sequential():
+    async def main():
+        return [await _lookup(i) for i in range(N)]
+    _run(main())
+
+
+def bench_lift():
+    async def main():
+        return await asyncmaybe.lift(_collect, *map(_lookup, range(N)))
+    _run(main())
@@ -0,0 +1,78 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for chains of fmap() and bind() calls of various depths."""
+
+import mir.monads.id as id_
+import mir.monads.maybe as maybe
+
+N = 10000
+
+
+def _add_one(a):
+    return a + 1
+
+
+def _just_add_one(a):
+    return maybe.Just(a + 1)
+
+
+def _identity_add_one(a):
+    return id_.Identity(a + 1)
+
+
+def _fmap_chain(m, depth):
+    for _ in range(N):
+        x = m
+        for _ in range(depth):
+            x = x.fmap(_add_one)
+
+
+def _bind_chain(m, f, depth):
+    for _ in range(N):
+        x = m
+        for _ in range(depth):
+            x = x.bind(f)
+
+
+def bench_just_fmap_depth_1():
+    _fmap_chain(maybe.Just(0), 1)
+
+
+def bench_just_fmap_depth_10():
+    _fmap_chain(maybe.Just(0), 10)
+
+
+def bench_just_bind_depth_1():
+    _bind_chain(maybe.Just(0), _just_add_one, 1)
+
+
+def bench_just_bind_depth_10():
+    _bind_chain(maybe.Just(0), _just_add_one, 10)
+
+
+def bench_identity_fmap_depth_1():
+    _fmap_chain(id_.Identity(0), 1)
+
+
+def bench_identity_fmap_depth_10():
+    _fmap_chain(id_.Identity(0), 10)
+
+
+def bench_identity_bind_depth_1():
+    _bind_chain(id_.Identity(0), _identity_add_one, 1)
+
+
+def bench_identity_bind_depth_10():
+    _bind_chain(id_.Identity(0), _identity_add_one, 10)
@@ -0,0 +1,48 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for compact batch encoding against pickle.
+
+The retained memory of the dumps benchmarks is the size of the encoding.
+"""
+
+import pickle
+
+from mir.monads import codec
+from mir.monads.id import Identity
+import mir.monads.maybe as maybe
+
+N = 100000
+
+_values = ([maybe.Just(i) for i in range(N // 2)]
+           + [maybe.Nothing()] * (N // 4)
+           + [Identity(str(i)) for i in range(N // 4)])
+_pickled = pickle.dumps(_values, pickle.HIGHEST_PROTOCOL)
+_encoded = codec.dumps(_values)
+
+
+def bench_pickle_dumps():
+    return pickle.dumps(_values, pickle.HIGHEST_PROTOCOL)
+
+
+def bench_codec_dumps():
+    return codec.dumps(_values)
+
+
+def bench_pickle_loads():
+    pickle.loads(_pickled)
+
+
+def bench_codec_loads():
+    codec.loads(_encoded)
@@ -0,0 +1,138 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for data constructors."""
+
+import mir.monads.data as data
+import mir.monads.id as id_
+import mir.monads.maybe as maybe
+
+N = 100000
+
+
+class Nullary(metaclass=data.Constructor):
+    arity = 0
+
+
+class Unary(metaclass=data.Constructor):
+    arity = 1
+
+
+class Binary(metaclass=data.Constructor):
+    arity = 2
+
+
+class Ternary(metaclass=data.Constructor):
+    arity = 3
+
+
+def bench_construct_nullary():
+    for _ in range(N):
+        Nullary()
+
+
+def bench_construct_unary():
+    for i in range(N):
+        Unary(i)
+
+
+def bench_construct_binary():
+    for i in range(N):
+        Binary(i, i)
+
+
+def bench_construct_ternary():
+    for i in range(N):
+        Ternary(i, i, i)
+
+
+def bench_eq():
+    x, y = Binary(1, 2), Binary(1, 2)
+    for _ in range(N):
+        x == y
+
+
+def bench_ne():
+    x, y = Binary(1, 2), Binary(1, 3)
+    for _ in range(N):
+        x != y
+
+
+def bench_just_fmap():
+    m = maybe.Just(1)
+    for _ in range(N):
+        m.fmap(abs)
+
+
+def bench_just_bind():
+    m = maybe.Just(1)
+    for _ in range(N):
+        m.bind(maybe.Just)
+
+
+def bench_identity_fmap():
+    m = id_.Identity(1)
+    for _ in range(N):
+        m.fmap(abs)
+
+
+def bench_identity_bind():
+    m = id_.Identity(1)
+    for _ in range(N):
+        m.bind(id_.Identity)
+
+
+class CachedHash(metaclass=data.Constructor):
+    arity = 1
+    cache_hash = True
+
+
+_nested = tuple(maybe.Just(i) for i in range(1000))
+
+
+def bench_hash_nested():
+    x = Unary(_nested)
+    for _ in range(N // 100):
+        hash(x)
+
+
+def bench_hash_nested_cached():
+    x = CachedHash(_nested)
+    for _ in range(N // 100):
+        hash(x)
+
+
+def bench_set_of_just():
+    return {maybe.Just(i % 1000) for i in range(N)}
+
+
+class Interned(metaclass=data.Constructor):
+    arity = 1
+    intern = 1024
+
+
+_duplicates = [i % 1000 for i in range(N)]
+
+
+def bench_duplicates_unary():
+    return [Unary(i) for i in _duplicates]
+
+
+def bench_duplicates_interned():
+    return [Interned(i) for i in _duplicates]
+
+
+def bench_construct_interned_misses():
+    for i in range(N):
+        Interned(i)
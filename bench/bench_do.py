@@ -0,0 +1,80 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for do-notation against nested binds."""
+
+from mir.monads.do import do
+import mir.monads.either as either
+import mir.monads.maybe as maybe
+
+N = 20000
+
+
+def _nested(m):
+    return m.bind(
+        lambda a: m.bind(
+            lambda b: m.bind(
+                lambda c: m.bind(
+                    lambda d: m.bind(
+                        lambda e: maybe.Just(a + b + c + d + e))))))
+
+
+@do
+def _do(m):
+    a = yield m
+    b = yield m
+    c = yield m
+    d = yield m
+    e = yield m
+    return maybe.Just(a + b + c + d + e)
+
+
+@do
+def _do_either(m):
+    a = yield m
+    b = yield m
+    c = yield m
+    d = yield m
+    e = yield m
+    return either.Right(a + b + c + d + e)
+
+
+def bench_nested_binds_just():
+    m = maybe.Just(1)
+    for _ in range(N):
+        _nested(m)
+
+
+def bench_do_just():
+    m = maybe.Just(1)
+    for _ in range(N):
+        _do(m)
+
+
+def bench_nested_binds_nothing():
+    m = maybe.Nothing()
+    for _ in range(N):
+        _nested(m)
+
+
+def bench_do_nothing():
+    m = maybe.Nothing()
+    for _ in range(N):
+        _do(m)
+
+
+def bench_do_right():
+    m = either.Right(1)
+    for _ in range(N):
+        _do_either(m)
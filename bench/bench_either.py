@@ -0,0 +1,54 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for failure heavy workloads with Either against Maybe."""
+
+import mir.monads.either as either
+import mir.monads.maybe as maybe
+
+N = 100000
+
+_inputs = ['x'] * (N * 9 // 10) + ['1'] * (N // 10)
+
+
+def _parse_raising(s):
+    if not s.isdigit():
+        raise ValueError('not a number: %r' % (s,))
+    return int(s)
+
+
+def _parse_returning(s):
+    if not s.isdigit():
+        return either.Left('not a number: %r' % (s,))
+    return int(s)
+
+
+_maybe_parse = maybe.monadic(_parse_raising)
+_either_parse = either.monadic(_parse_returning)
+_either_catching_parse = either.catching(_parse_raising)
+
+
+def bench_maybe_monadic_raising():
+    for s in _inputs:
+        _maybe_parse(s)
+
+
+def bench_either_monadic_returning():
+    for s in _inputs:
+        _either_parse(s)
+
+
+def bench_either_catching_raising():
+    for s in _inputs:
+        _either_catching_parse(s)
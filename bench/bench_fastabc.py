@@ -0,0 +1,76 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for fastabc against abc classes."""
+
+import mir.monads.abc as monads_abc
+import mir.monads.data as data
+from mir.monads import fastabc
+
+N = 100000
+CLASSES = 1000
+
+
+def _methods():
+    return {
+        'arity': 1,
+        'fmap': lambda self, f: self,
+        'apply': lambda self, other: self,
+        'bind': lambda self, f: self,
+    }
+
+
+class AbcType(monads_abc.Monad):
+    pass
+
+
+class FastType(fastabc.Monad, abstract=True):
+    __slots__ = ()
+
+
+AbcValue = data.Constructor('AbcValue', (AbcType,), _methods())
+FastValue = fastabc.Constructor('FastValue', (FastType,), _methods())
+
+_abc_value = AbcValue(1)
+_fast_value = FastValue(1)
+
+
+def bench_isinstance_abc_type():
+    for _ in range(N):
+        isinstance(_abc_value, AbcType)
+
+
+def bench_isinstance_fast_type():
+    for _ in range(N):
+        isinstance(_fast_value, FastType)
+
+
+def bench_isinstance_abc_monad_false():
+    for _ in range(N):
+        isinstance(1, monads_abc.Monad)
+
+
+def bench_isinstance_fast_monad_false():
+    for _ in range(N):
+        isinstance(1, fastabc.Monad)
+
+
+def bench_class_creation_abc():
+    for i in range(CLASSES):
+        data.Constructor('AbcValue%d' % i, (AbcType,), _methods())
+
+
+def bench_class_creation_fast():
+    for i in range(CLASSES):
+        fastabc.Constructor('FastValue%d' % i, (FastType,), _methods())
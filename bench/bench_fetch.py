@@ -0,0 +1,55 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for batched fetching against one lookup at a time."""
+
+import time
+
+import mir.monads.fetch as fetch
+
+N = 200
+# Simulated round trip time of a data source in seconds.
+LATENCY = 0.0005
+
+
+class _Source(fetch.DataSource):
+
+    def fetch(self, keys):
+        time.sleep(LATENCY)
+        return {key: key * 2 for key in keys}
+
+
+_source = _Source()
+_keys = [i % (N // 2) for i in range(N)]
+
+
+def _lookup(key):
+    return fetch.request(_source, key).fmap(lambda value: value + 1)
+
+
+def bench_fetch_one_at_a_time():
+    for key in _keys:
+        fetch.run(_lookup(key))
+
+
+def bench_fetch_bind_chain():
+    m = fetch.done([])
+    for key in _keys:
+        m = m.bind(lambda values, key=key: _lookup(key).fmap(
+            lambda value: values + [value]))
+    fetch.run(m)
+
+
+def bench_fetch_traverse():
+    fetch.run(fetch.traverse(_lookup, _keys))
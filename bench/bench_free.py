@@ -0,0 +1,65 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for interpreting Free monad programs."""
+
+import mir.monads.data as data
+import mir.monads.free as free
+
+N = 50000
+
+
+class Incr(metaclass=data.Constructor):
+    arity = 0
+
+
+_interpreter = free.Interpreter({Incr: lambda e: 1})
+
+
+def _add(x):
+    return free.send(Incr()).fmap(lambda y: x + y)
+
+
+def bench_left_nested_binds():
+    program = free.Pure(0)
+    for _ in range(N):
+        program = program.bind(_add)
+    _interpreter.run(program)
+
+
+def _loop(n, total):
+    if n == 0:
+        return free.Pure(total)
+    return free.send(Incr()).bind(lambda x: _loop(n - 1, total + x))
+
+
+def bench_right_nested_binds():
+    _interpreter.run(_loop(N, 0))
+
+
+_steps = [_add] * 5
+
+
+def bench_workflow_binds():
+    for i in range(N // 5):
+        program = free.Pure(i)
+        for step in _steps:
+            program = program.bind(step)
+        _interpreter.run(program)
+
+
+def bench_workflow_compiled():
+    workflow = _interpreter.compile(*_steps)
+    for i in range(N // 5):
+        workflow(i)
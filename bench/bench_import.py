@@ -0,0 +1,49 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for import time.
+
+Each benchmark starts a new interpreter, so compare the import benchmarks
+against bench_python_startup.
+"""
+
+import pathlib
+import subprocess
+import sys
+
+_ROOT = str(pathlib.Path(__file__).resolve().parent.parent)
+
+
+def _run(code):
+    subprocess.run([sys.executable, '-c', code], cwd=_ROOT, check=True)
+
+
+def bench_python_startup():
+    _run('pass')
+
+
+def bench_import_maybe():
+    _run('import mir.monads.maybe')
+
+
+def bench_import_id():
+    _run('import mir.monads.id')
+
+
+def bench_import_abc():
+    _run('import mir.monads.abc')
+
+
+def bench_import_fastabc():
+    _run('import mir.monads.fastabc')
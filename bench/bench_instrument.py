@@ -0,0 +1,39 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for the overhead of instrumentation."""
+
+from mir.monads import instrument
+import mir.monads.maybe as maybe
+
+N = 100000
+
+
+def _fmap_loop():
+    m = maybe.Just(1)
+    for _ in range(N):
+        m.fmap(abs)
+
+
+def bench_fmap_disabled():
+    _fmap_loop()
+
+
+def bench_fmap_enabled():
+    instrument.enable()
+    try:
+        _fmap_loop()
+    finally:
+        instrument.disable()
+        instrument.reset()
@@ -0,0 +1,104 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for the Maybe monad."""
+
+import mir.monads.maybe as maybe
+
+N = 100000
+
+_nothing = maybe.Nothing()
+_just = maybe.Just(1)
+
+
+def _none(a):
+    return None
+
+
+_fail = maybe.monadic(_none)
+
+
+def bench_nothing_construct():
+    return [maybe.Nothing() for _ in range(N)]
+
+
+def bench_nothing_fmap():
+    return [_nothing.fmap(abs) for _ in range(N)]
+
+
+def bench_nothing_bind():
+    return [_nothing.bind(abs) for _ in range(N)]
+
+
+def bench_just_fmap_to_nothing():
+    return [_just.fmap(_none) for _ in range(N)]
+
+
+def bench_monadic_to_nothing():
+    return [_fail(i) for i in range(N)]
+
+
+def bench_just_fmap():
+    return [_just.fmap(abs) for _ in range(N)]
+
+
+def _lookup(key):
+    return sum(range(1000)) if key % 2 else None
+
+
+_uncached_lookup = maybe.monadic(_lookup)
+_cached_lookup = maybe.cached_monadic(maxsize=1000)(_lookup)
+_keys = [i % 500 for i in range(N // 10)]
+
+
+def bench_monadic_repeated_keys():
+    for key in _keys:
+        _uncached_lookup(key)
+
+
+def bench_cached_monadic_repeated_keys():
+    for key in _keys:
+        _cached_lookup(key)
+
+
+def _record(a, b, c, d, e, f, g, h):
+    return (a, b, c, d, e, f, g, h)
+
+
+def _curried_record(a):
+    return lambda b: lambda c: lambda d: lambda e: lambda f: lambda g: (
+        lambda h: _record(a, b, c, d, e, f, g, h))
+
+
+_fields = [maybe.Just(i) for i in range(8)]
+
+
+def bench_apply_8_fields():
+    for _ in range(N // 10):
+        m = maybe.Just(_curried_record)
+        for field in _fields:
+            m = m.apply(field)
+
+
+def bench_lift_8_fields():
+    for _ in range(N // 10):
+        maybe.lift(_record, *_fields)
+
+
+_columns = [[field] * (N // 10) for field in _fields]
+
+
+def bench_map_n_8_fields():
+    for _ in maybe.map_n(_record, *_columns):
+        pass
@@ -0,0 +1,82 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for streaming Maybe combinators against list idioms."""
+
+import collections
+
+import mir.monads.maybe as maybe
+
+N = 100000
+
+_values = [i % 3 for i in range(N)]
+
+
+def _invert(a):
+    return 1 / a
+
+
+_monadic_invert = maybe.monadic(_invert)
+
+
+def bench_list_idiom():
+    maybes = [_monadic_invert(a) for a in _values]
+    total = 0
+    for value in [m.value for m in maybes if m is not maybe.Nothing()]:
+        total += value
+    return total
+
+
+def bench_map_maybe():
+    total = 0
+    for value in maybe.map_maybe(_invert, _values):
+        total += value
+    return total
+
+
+def bench_map_maybe_chunks():
+    total = 0
+    for chunk in maybe.map_maybe_chunks(_invert, _values, 1000):
+        total += sum(chunk)
+    return total
+
+
+def bench_partition_maybes():
+    successes, failures = maybe.partition_maybes(_invert, _values)
+    collections.deque(zip(successes, failures), maxlen=0)
+
+
+_ones = [1] * N
+
+
+def _add(acc, a):
+    return maybe.Just(acc + a)
+
+
+def bench_sequence():
+    maybe.sequence(map(_monadic_invert, _ones))
+
+
+def bench_sequence_into():
+    maybe.sequence_into(map(_monadic_invert, _ones), lambda value: None)
+
+
+def bench_fold_with_binds():
+    m = maybe.Just(0)
+    for a in _ones:
+        m = m.bind(lambda acc, a=a: _add(acc, a))
+
+
+def bench_fold_m():
+    maybe.fold_m(_add, 0, _ones)
@@ -0,0 +1,59 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for MaybeArray against lists of Maybe values."""
+
+import numpy
+
+import mir.monads.maybe as maybe
+from mir.monads.maybearray import MaybeArray
+
+N = 1000000
+
+_values = [float(i % 100) or None for i in range(N)]
+_maybes = [maybe.Just(v) if v is not None else maybe.Nothing()
+           for v in _values]
+_array = MaybeArray.from_values(_values)
+# One value in a hundred is zero, so inverting it fails.
+_zeros = [float(i % 100) for i in range(N)]
+_zeros_maybes = [maybe.Just(v) for v in _zeros]
+_zeros_array = MaybeArray.from_values(_zeros)
+
+
+def _scale(x):
+    return x * 2.0 + 1.0
+
+
+def _invert(x):
+    return 1 / x
+
+
+def bench_maybe_list_fmap():
+    return [m.fmap(_scale) for m in _maybes]
+
+
+def bench_maybe_array_fmap():
+    return _array.fmap(_scale)
+
+
+def bench_maybe_array_fmap_ufunc():
+    return _array.fmap(numpy.log)
+
+
+def bench_maybe_list_fmap_failing():
+    return [m.fmap(_invert) for m in _zeros_maybes]
+
+
+def bench_maybe_array_fmap_failing():
+    return _zeros_array.fmap(_invert)
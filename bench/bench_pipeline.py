@@ -0,0 +1,87 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for fused pipelines against method chains."""
+
+import mir.monads.id as id_
+import mir.monads.maybe as maybe
+from mir.monads.pipeline import IdentityPipeline
+from mir.monads.pipeline import MaybePipeline
+
+N = 10000
+STAGES = 20
+
+_values = list(range(N))
+
+
+def _add_one(a):
+    return a + 1
+
+
+def _identity_pipeline():
+    p = IdentityPipeline()
+    for _ in range(STAGES):
+        p = p.fmap(_add_one)
+    return p
+
+
+def _maybe_pipeline():
+    p = MaybePipeline()
+    for _ in range(STAGES):
+        p = p.fmap(_add_one)
+    return p
+
+
+_identity = _identity_pipeline()
+_maybe = _maybe_pipeline()
+
+
+def bench_identity_chain():
+    for x in _values:
+        m = id_.Identity(x)
+        for _ in range(STAGES):
+            m = m.fmap(_add_one)
+
+
+def bench_identity_pipeline():
+    for _ in _identity.run_many(_values):
+        pass
+
+
+def bench_maybe_chain():
+    for x in _values:
+        m = maybe.Just(x)
+        for _ in range(STAGES):
+            m = m.fmap(_add_one)
+
+
+def bench_maybe_pipeline():
+    for _ in _maybe.run_many(_values):
+        pass
+
+
+_monadic_add_one = maybe.monadic(_add_one)
+_composed = MaybePipeline.compose(*[_monadic_add_one] * STAGES)
+
+
+def bench_maybe_monadic_binds():
+    for x in _values:
+        m = _monadic_add_one(x)
+        for _ in range(STAGES - 1):
+            m = m.bind(_monadic_add_one)
+
+
+def bench_maybe_monadic_compose():
+    for _ in _composed.run_many(_values):
+        pass
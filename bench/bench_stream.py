@@ -0,0 +1,62 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for searches with Stream against eager lists."""
+
+import mir.monads.stream as stream
+from mir.monads.stream import Stream
+
+N = 60
+
+
+def _eager_triples(n):
+    return [(a, b, c)
+            for a in [a for a in range(1, n)]
+            for b in [b for b in range(a, n)]
+            for c in [c for c in range(b, n)]
+            if a * a + b * b == c * c]
+
+
+def _triples(n):
+    return Stream(range(1, n)).bind(
+        lambda a: Stream(range(a, n)).bind(
+            lambda b: Stream(range(b, n)).bind(
+                lambda c: stream.guard(a * a + b * b == c * c).fmap(
+                    lambda _: (a, b, c)))))
+
+
+def _eager_product(n):
+    pairs = [(a, b) for a in range(n) for b in range(n)]
+    return [(a, b, c) for a, b in pairs for c in range(n)]
+
+
+def bench_eager_triples():
+    _eager_triples(N)
+
+
+def bench_stream_triples():
+    list(_triples(N).iterable)
+
+
+def bench_stream_triples_first():
+    _triples(N).first()
+
+
+def bench_eager_product_first():
+    _eager_product(N)[0]
+
+
+def bench_stream_product_first():
+    r = Stream(range(N))
+    r.bind(lambda a: r.bind(lambda b: r.fmap(lambda c: (a, b, c)))).first()
@@ -0,0 +1,67 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for tracing failures."""
+
+import mir.monads.maybe as maybe
+import mir.monads.trace as trace
+
+N = 100000
+
+
+def _invert(a):
+    return 1 / a
+
+
+_just_one = maybe.Just(1)
+_just_zero = maybe.Just(0)
+
+
+def _fmap_many(m):
+    for _ in range(N):
+        m.fmap(_invert)
+
+
+def bench_success_untraced():
+    _fmap_many(_just_one)
+
+
+def bench_success_traced():
+    trace.enable(rate=1)
+    try:
+        _fmap_many(_just_one)
+    finally:
+        trace.disable()
+
+
+def bench_failure_untraced():
+    _fmap_many(_just_zero)
+
+
+def bench_failure_traced():
+    trace.enable(rate=1)
+    try:
+        _fmap_many(_just_zero)
+    finally:
+        trace.disable()
+        trace.clear()
+
+
+def bench_failure_traced_sampled():
+    trace.enable(rate=0.01)
+    try:
+        _fmap_many(_just_zero)
+    finally:
+        trace.disable()
+        trace.clear()
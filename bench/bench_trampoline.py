@@ -0,0 +1,61 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for trampolined binds.
+
+The time per step should stay the same as the number of steps grows.
+"""
+
+import mir.monads.maybe as maybe
+
+
+def _count_down(n):
+    if n == 0:
+        return maybe.Just(0)
+    return maybe.Just(n - 1).lazy_bind(_count_down)
+
+
+def _left_nested(n):
+    m = maybe.Just(0)
+    for _ in range(n):
+        m = m.lazy_bind(_increment)
+    return m.run()
+
+
+def _increment(x):
+    return maybe.Just(x + 1)
+
+
+def bench_right_nested_10k():
+    _count_down(10 ** 4).run()
+
+
+def bench_right_nested_100k():
+    _count_down(10 ** 5).run()
+
+
+def bench_right_nested_1m():
+    _count_down(10 ** 6).run()
+
+
+def bench_left_nested_10k():
+    _left_nested(10 ** 4)
+
+
+def bench_left_nested_100k():
+    _left_nested(10 ** 5)
+
+
+def bench_left_nested_1m():
+    _left_nested(10 ** 6)
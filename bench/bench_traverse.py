@@ -0,0 +1,44 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for traverse() with and without executors.
+
+The process pool benchmark should scale with the number of CPUs.
+"""
+
+import concurrent.futures
+import os
+
+import mir.monads.maybe as maybe
+
+N = 2000
+
+_inputs = [str(i) for i in range(N)]
+
+
+@maybe.monadic
+def _parse(s):
+    total = 0
+    for i in range(2000):
+        total += int(s) * i
+    return total
+
+
+def bench_traverse_serial():
+    return maybe.traverse(_parse, _inputs)
+
+
+def bench_traverse_process_pool():
+    with concurrent.futures.ProcessPoolExecutor(os.cpu_count()) as executor:
+        return maybe.traverse(_parse, _inputs, executor, chunksize=100)
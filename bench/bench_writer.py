@@ -0,0 +1,45 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for long chains of Writer binds."""
+
+import mir.monads.writer as writer
+
+N = 100000
+
+
+def _step(x):
+    return writer.writer(x + 1, x)
+
+
+def bench_writer_chain():
+    m = writer.writer(0)
+    for _ in range(N):
+        m = m.bind(_step)
+    list(m.log)
+
+
+def bench_writer_chain_streaming():
+    entries = []
+    with writer.streaming(entries.append):
+        m = writer.writer(0)
+        for _ in range(N):
+            m = m.bind(_step)
+
+
+def bench_writer_chain_discarded():
+    with writer.streaming(lambda entry: None):
+        m = writer.writer(0)
+        for _ in range(N):
+            m = m.bind(_step)
@@ -0,0 +1,137 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run benchmarks.
+
+Usage:
+
+    python bench/run.py [--json FILE] [--compare FILE] [MODULE ...]
+
+Benchmark modules live in the bench directory and are named bench_*.py.
+Every module level function named bench_* is a benchmark.  It is called
+with no arguments.  Its run time is measured, as is its peak memory use
+and the memory still held by its return value, so benchmarks that build
+results should return them.
+
+With --json, the results are also written to FILE as JSON.  With
+--compare, the results are compared to the results in a JSON file written
+by an earlier run, for example on another revision:
+
+    git checkout v1.0.1 && python bench/run.py --json old.json
+    git checkout master && python bench/run.py --compare old.json
+"""
+
+import argparse
+import importlib
+import json
+import pathlib
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+BENCH_DIR = pathlib.Path(__file__).resolve().parent
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('modules', nargs='*')
+    parser.add_argument('--json', metavar='FILE',
+                        help='write results to FILE')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare with the results in FILE')
+    args = parser.parse_args()
+    sys.path.insert(0, str(BENCH_DIR))
+    sys.path.insert(0, str(BENCH_DIR.parent))
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['benchmarks']
+    results = {}
+    for name in args.modules or _module_names():
+        try:
+            module = importlib.import_module(name)
+        except ImportError as e:
+            print('%s: skipped (%s)' % (name, e))
+            continue
+        for bench_name, func in _benchmarks(module):
+            full_name = '%s.%s' % (name, bench_name)
+            seconds = _time(func)
+            retained, peak = _memory(func)
+            results[full_name] = {
+                'seconds': seconds,
+                'retained_bytes': retained,
+                'peak_bytes': peak,
+            }
+            line = ('%s: %.3f ms, %d KiB retained, %d KiB peak'
+                    % (full_name, seconds * 1000,
+                       retained // 1024, peak // 1024))
+            if full_name in baseline:
+                line += ' (%.2fx time of baseline)' % (
+                    seconds / baseline[full_name]['seconds'])
+            print(line)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'revision': _revision(),
+                'python': platform.python_version(),
+                'benchmarks': results,
+            }, f, indent=2, sort_keys=True)
+
+
+def _module_names():
+    """Return the names of all benchmark modules."""
+    return sorted(path.stem for path in BENCH_DIR.glob('bench_*.py'))
+
+
+def _benchmarks(module):
+    """Yield the (name, function) pairs of benchmarks in a module."""
+    for name, value in sorted(vars(module).items()):
+        if name.startswith('bench_') and callable(value):
+            yield name, value
+
+
+def _revision():
+    """Return the git revision of the repository, or None."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=str(BENCH_DIR),
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            universal_newlines=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _time(func):
+    """Return the best time in seconds of a single call to func."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def _memory(func):
+    """Return the bytes held by the return value of func and the peak."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = func()  # noqa: F841
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return after - before, peak - before
+
+
+if __name__ == '__main__':
+    main()
@@ -16,7 +16,23 @@
 
 Modules:
 
-abc
+abc -- Abstract base classes
+asyncmaybe -- Maybe monad for asyncio
+codec -- Compact batch encoding of data constructor values
+data -- Data constructors
+do -- Do-notation
+either -- Either monad
+fastabc -- Lightweight abstract base classes
+fetch -- Fetch monad for batched data fetching
+free -- Free monad
+id -- Identity monad
+instrument -- Runtime instrumentation of monad operations
+maybe -- Maybe monad
+maybearray -- Columnar Maybe monad backed by NumPy
+pipeline -- Fused pipelines
+stream -- Lazy List monad
+trace -- Tracing where Maybe computations fail
+writer -- Writer monad
 """
 
 __version__ = '1.0.1'
@@ -18,6 +18,7 @@ Classes:
 Functor -- Functor abstract base class
 Applicative -- Applicative abstract base class
 Monad -- Monad abstract base class
+Bind -- Suspended bind
 """
 
 import abc
@@ -69,9 +70,61 @@ class Monad(Applicative):
 
     Implemented methods:
     bind -- (>>=)
+
+    Monads also support trampolined binds through lazy_bind().  Chains of
+    lazy binds, nested on either side, run in constant stack space.  This
+    works for monads whose bind() calls its function at most once, like
+    Maybe and Identity.
     """
 
     @abc.abstractmethod
     def bind(self, f):
         """Apply the function to the monad."""
         raise NotImplementedError
+
+    def lazy_bind(self, f):
+        """Return a suspended bind of the function to the monad.
+
+        The function may return another suspended bind instead of calling
+        bind() itself.  Call run() on the result to get the final monad.
+        """
+        return Bind(self, 'bind', f)
+
+
+class Bind(Monad):
+
+    """Suspended bind
+
+    A suspended bind holds a monad and a method call to make on it.  Calling
+    fmap(), apply() or bind() on a suspended bind suspends the call too.
+    run() makes the calls with an explicit stack instead of recursion.
+    """
+
+    __slots__ = ('_monad', '_method', '_arg')
+
+    def __init__(self, monad, method, arg):
+        self._monad = monad
+        self._method = method
+        self._arg = arg
+
+    def fmap(self, f):
+        return Bind(self, 'fmap', f)
+
+    def apply(self, other):
+        return Bind(self, 'apply', other)
+
+    def bind(self, f):
+        return Bind(self, 'bind', f)
+
+    def run(self):
+        """Run the suspended bind and return the resulting monad."""
+        stack = []
+        m = self
+        while True:
+            while type(m) is Bind:
+                stack.append((m._method, m._arg))
+                m = m._monad
+            if not stack:
+                return m
+            method, arg = stack.pop()
+            m = getattr(m, method)(arg)
@@ -0,0 +1,175 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Maybe monad for asyncio.
+
+AsyncMaybe is an awaitable that resolves to a Maybe monad.  Its methods
+accept both plain functions and coroutine functions.  apply() and lift()
+run independent AsyncMaybe monads concurrently:
+
+    @monadic
+    async def lookup(key):
+        ...
+
+    user = await lift(make_user, lookup('name'), lookup('email'))
+
+Functions:
+monadic -- Decorate a coroutine function to return AsyncMaybe
+lift -- Apply a function to several AsyncMaybe monads concurrently
+
+Classes:
+AsyncMaybe -- Awaitable Maybe monad
+"""
+
+import asyncio
+import functools
+import inspect
+
+import mir.monads.abc as monads_abc
+import mir.monads.maybe as maybe
+
+_nothing = maybe.Nothing()
+
+
+class AsyncMaybe(monads_abc.Monad):
+
+    """Awaitable Maybe monad
+
+    An AsyncMaybe wraps an awaitable that resolves to a Maybe monad.  The
+    awaitable is not started until the AsyncMaybe is first awaited, and it
+    is run only once no matter how many times the AsyncMaybe is awaited.
+    """
+
+    __slots__ = ('_awaitable', '_future')
+
+    def __init__(self, awaitable):
+        self._awaitable = awaitable
+        self._future = None
+
+    @classmethod
+    def from_maybe(cls, m):
+        """Return an AsyncMaybe that resolves to a Maybe monad."""
+        return cls(_return(m))
+
+    def __await__(self):
+        return self._resolve().__await__()
+
+    async def _resolve(self):
+        if self._future is None:
+            self._future = asyncio.ensure_future(self._awaitable)
+            self._awaitable = None
+        return await self._future
+
+    def fmap(self, f):
+        """Map a function or coroutine function over the monad.
+
+        The result follows the same rules as Just.fmap().
+        """
+        return AsyncMaybe(self._fmap(f))
+
+    async def _fmap(self, f):
+        m = await self
+        if m is _nothing:
+            return m
+        value, = m
+        return await _call(f, value)
+
+    def apply(self, other):
+        """Apply this monad to another Maybe or AsyncMaybe.
+
+        Both monads are awaited concurrently.
+        """
+        return lift(_apply_function, self, other)
+
+    def bind(self, f):
+        """Bind a function to the monad.
+
+        The function may return a Maybe, an AsyncMaybe or an awaitable that
+        resolves to a Maybe.
+        """
+        return AsyncMaybe(self._bind(f))
+
+    async def _bind(self, f):
+        m = await self
+        if m is _nothing:
+            return m
+        value, = m
+        result = f(value)
+        while inspect.isawaitable(result):
+            result = await result
+        return result
+
+
+def monadic(f):
+    """Decorate a unary coroutine function to return an AsyncMaybe.
+
+    The transformation rules for the function's return value are the same
+    as for maybe.monadic().
+    """
+    @functools.wraps(f)
+    def wrapped(a):
+        return AsyncMaybe(_call(f, a))
+    return wrapped
+
+
+def lift(f, *monads):
+    """Apply a function to the values of several monads concurrently.
+
+    The monads may be Maybe or AsyncMaybe monads.  They are awaited
+    concurrently with asyncio.gather().  If any of them is Nothing, the
+    result is Nothing; otherwise the function, which may be a coroutine
+    function, is called with their values following the rules of
+    Just.fmap().  Return an AsyncMaybe.
+    """
+    return AsyncMaybe(_lift(f, monads))
+
+
+async def _lift(f, monads):
+    results = await asyncio.gather(*map(_resolve, monads))
+    values = []
+    for m in results:
+        if m is _nothing:
+            return m
+        value, = m
+        values.append(value)
+    return await _call(f, *values)
+
+
+def _apply_function(f, value):
+    return f(value)
+
+
+async def _resolve(m):
+    """Return the Maybe monad of a Maybe or AsyncMaybe."""
+    if isinstance(m, AsyncMaybe):
+        return await m
+    return m
+
+
+async def _return(m):
+    return m
+
+
+async def _call(f, *args):
+    """Call a function or coroutine function following monadic() rules."""
+    try:
+        b = f(*args)
+        if inspect.isawaitable(b):
+            b = await b
+    except Exception:
+        b = None
+    if b is None:
+        return _nothing
+    else:
+        return maybe.Just(b)
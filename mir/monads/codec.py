@@ -0,0 +1,158 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact batch encoding of data constructor values.
+
+dumps() encodes a sequence of values as one tag byte per value followed by
+the contents of all of the values, pickled together.  Values of tagged data
+constructors (see mir.monads.data.Constructor) take much less space than
+they do with pickle, and a value with an arity of 0, such as Nothing(), is
+encoded as its tag alone.  Other values are pickled as usual.
+
+    data = codec.dumps([Just(1), Nothing(), Identity('a')])
+    codec.loads(data) == [Just(1), Nothing(), Identity('a')]
+
+Pickler and Unpickler pickle any object, writing values of tagged data
+constructors anywhere inside it as their tag and contents.  This makes
+pickles of single values, such as cache entries, less than half the size.
+For long sequences of values, where pickle writes each class name only
+once, use dumps() instead.  Pickler output can only be loaded by
+Unpickler.  Values pickled with the standard pickle module are not
+affected by tags, so they load in any process.
+
+    data = codec.pickle_dumps({'a': [Just(1), Nothing()]})
+    codec.pickle_loads(data) == {'a': [Just(1), Nothing()]}
+
+The modules defining the tagged classes must be imported before decoding.
+
+Functions:
+dumps -- Encode a sequence of values as bytes
+loads -- Decode bytes from dumps() into a list of values
+pickle_dumps -- Pickle an object with compact tagged values
+pickle_loads -- Unpickle an object pickled by pickle_dumps()
+
+Classes:
+Pickler -- Pickler writing tagged values compactly
+Unpickler -- Unpickler for Pickler
+"""
+
+import io
+
+import pickle
+
+import mir.monads.data as data
+
+# Tag for values that are not tagged data constructors.
+_UNTAGGED = 0
+
+
+def dumps(values, protocol=pickle.HIGHEST_PROTOCOL):
+    """Encode a sequence of values as bytes.
+
+    The contents of the values are pickled with the given protocol.
+    """
+    tags_by_class = {cls: tag for tag, cls in data.tagged_classes().items()}
+    tags = bytearray()
+    contents = []
+    for value in values:
+        tag = tags_by_class.get(value.__class__, _UNTAGGED)
+        tags.append(tag)
+        if tag == _UNTAGGED:
+            contents.append(value)
+        else:
+            contents.extend(value)
+    return pickle.dumps((bytes(tags), contents), protocol)
+
+
+def loads(encoded):
+    """Decode bytes from dumps() into a list of values."""
+    tags, contents = pickle.loads(encoded)
+    classes = data.tagged_classes()
+    decoders = [None] * (data.MAX_TAG + 1)
+    decoders[_UNTAGGED] = _decode_untagged
+    for tag in set(tags):
+        if tag != _UNTAGGED:
+            decoders[tag] = _decoder(classes[tag])
+    items = iter(contents)
+    return [decoders[tag](items) for tag in tags]
+
+
+def _decoder(cls):
+    """Return a function that decodes a value of cls from an iterator."""
+    if cls.arity == 0:
+        value = cls()
+        return lambda items: value
+    if cls.arity == 1:
+        return lambda items: cls(next(items))
+    arity = cls.arity
+    return lambda items: cls(*[next(items) for _ in range(arity)])
+
+
+def _decode_untagged(items):
+    return next(items)
+
+
+def pickle_dumps(obj, protocol=pickle.HIGHEST_PROTOCOL):
+    """Pickle an object with compact tagged values and return the bytes."""
+    file = io.BytesIO()
+    Pickler(file, protocol).dump(obj)
+    return file.getvalue()
+
+
+def pickle_loads(encoded):
+    """Unpickle an object pickled by pickle_dumps() or Pickler."""
+    return Unpickler(io.BytesIO(encoded)).load()
+
+
+class Pickler(pickle.Pickler):
+
+    """Pickler writing values of tagged data constructors compactly.
+
+    Values are written as their tag and contents instead of their module
+    and class name.  Protocol 0 pickles values as usual.
+    """
+
+    def __init__(self, file, protocol=None, **kwargs):
+        super().__init__(file, protocol, **kwargs)
+        self._tags = {cls: tag for tag, cls in data.tagged_classes().items()}
+        if protocol == 0:
+            self._tags = {}
+
+    def persistent_id(self, obj):
+        tag = self._tags.get(obj.__class__)
+        if tag is None:
+            return None
+        if obj.__class__.arity == 0:
+            return tag
+        return (tag,) + tuple(obj)
+
+
+class Unpickler(pickle.Unpickler):
+
+    """Unpickler for pickles written by Pickler."""
+
+    def __init__(self, file, **kwargs):
+        super().__init__(file, **kwargs)
+        self._classes = data.tagged_classes()
+
+    def persistent_load(self, pid):
+        if isinstance(pid, int):
+            tag, contents = pid, ()
+        else:
+            tag, *contents = pid
+        try:
+            cls = self._classes[tag]
+        except KeyError:
+            raise pickle.UnpicklingError('unknown tag %r' % (tag,)) from None
+        return cls(*contents)
@@ -14,18 +14,88 @@
 
 """Data constructors for Python.
 
+Functions:
+tagged_classes -- Return the data constructors that have tags
+set_interning -- Turn interning of a data constructor's values on or off
+intern_info -- Return statistics for interned values
+intern_clear -- Clear the interned values of a data constructor
+
 Classes:
 Constructor -- Data constructor metaclass
+BaseConstructor -- Data constructor metaclass without abc support
+InternInfo -- Statistics for interned values
 """
 
 import abc
+import collections
+import functools
+import keyword
+import operator
+import sys
+
+# Tags below this are reserved for data constructors in mir.monads.
+FIRST_USER_TAG = 64
+MAX_TAG = 255
+# Size of intern tables for classes that define intern = True.
+DEFAULT_INTERN_SIZE = 65536
+
+
+class BaseConstructor(type):
+
+    """Metaclass for data constructors without abstract base class support.
+
+    This has the same behavior as Constructor, but does not derive from
+    abc.ABCMeta, so it can be combined with other metaclasses, such as
+    mir.monads.fastabc.Interface.
+    """
+
+    def __new__(meta, name, bases, dct, **kwargs):
+        fields = _pop_fields(dct)
+        hashable = dct.pop('hashable', True)
+        cache_hash = dct.pop('cache_hash', False)
+        intern = dct.pop('intern', False)
+        dct['__slots__'] = ()
+        namespace = {'_tuple_new': tuple.__new__, '_tuple_eq': tuple.__eq__,
+                     '_tuple_hash': tuple.__hash__, '_hashes': {}}
+        exec(_method_code(len(fields)), namespace)
+        for method in _METHODS:
+            dct[method] = namespace[method]
+        if not hashable:
+            dct['__hash__'] = None
+        elif cache_hash and fields:
+            exec(_CACHED_HASH_CODE, namespace)
+            dct['__hash__'] = namespace['__hash__']
+            dct['__del__'] = namespace['__del__']
+        else:
+            dct['__hash__'] = namespace['__hash__']
+        dct['arity'] = len(fields)
+        for i, field in enumerate(fields):
+            if field is not None:
+                if field in dct:
+                    raise ValueError(
+                        'Field name %r conflicts with an attribute' % (field,))
+                dct[field] = property(operator.itemgetter(i),
+                                      doc='Value %d of the constructor' % i)
+        bases += (tuple,)
+        cls = super(BaseConstructor, meta).__new__(meta, name, bases, dct,
+                                                   **kwargs)
+        namespace['_cls'] = cls
+        if not fields:
+            namespace['_instance'] = tuple.__new__(cls)
+        if intern:
+            set_interning(
+                cls, DEFAULT_INTERN_SIZE if intern is True else intern)
+        if dct.get('tag') is not None:
+            _register_tag(cls)
+        return cls
 
 
-class Constructor(abc.ABCMeta):
+class Constructor(BaseConstructor, abc.ABCMeta):
 
     """Metaclass for Haskell-like data constructors.
 
-    Classes must define an arity class attribute.
+    Classes must define an arity class attribute, or a fields class attribute
+    naming the values.
 
     Example:
 
@@ -44,35 +114,289 @@ class Constructor(abc.ABCMeta):
     instances from regular tuples:
 
         value, = SomeValue(value)
+
+    If fields is defined instead of arity, the values can also be accessed by
+    name, like Haskell's record syntax:
+
+        class SomeValue(SomeType, metaclass=Constructor):
+            fields = ('value',)
+
+        SomeValue(1).value == 1
+
+    Data constructors with an arity of 0 have exactly one instance, so they
+    can be compared by identity:
+
+        SomeValue() is SomeValue()
+
+    Values are hashable if their contents are.  The data constructor is part
+    of the hash, so SomeValue(1) and (1,) hash differently.  Classes for
+    values that hold mutable objects can define ``hashable = False`` to make
+    their values unhashable.  Classes for values that are hashed often and
+    hold large values can define ``cache_hash = True`` to compute the hash of
+    each value only once.
+
+    Classes can define a tag class attribute, an integer that identifies
+    the data constructor in the compact serialized forms of
+    mir.monads.codec.  Tags do not change how values are pickled by default.
+    Tags from 1 to FIRST_USER_TAG - 1 are reserved for mir.monads, and user
+    tags go up to MAX_TAG.
+
+    Classes can define ``intern = True``, or the maximum number of values to
+    keep, to intern their values: constructing a value equal to a recently
+    constructed one returns the same instance, so duplicates share memory
+    and compare by identity.  See set_interning().
+
+    The methods of data constructors are generated for each arity, so that
+    constructing and comparing values is as fast as possible.
     """
 
-    def __new__(meta, name, bases, dct):
-        arity = int(dct.pop('arity'))
-        dct['__slots__'] = ()
-        dict_method = _dict_method_adder(dct)
 
-        @dict_method
-        def __new__(cls, *values):
-            if len(values) != arity:
-                raise TypeError('__new__() takes %d arguments' % (arity,))
-            return tuple.__new__(cls, values)
+_tagged = {}
 
-        @dict_method
-        def __eq__(self, other):
-            return (isinstance(other, type(self))
-                    and super(type(self), self).__eq__(other))
 
-        @dict_method
-        def __ne__(self, other):
-            return not self == other
+def tagged_classes():
+    """Return a dict mapping tags to the data constructors that have them."""
+    return dict(_tagged)
+
+
+def _register_tag(cls):
+    """Register the tag of a data constructor class.
+
+    If a class with the same module and qualified name already has the
+    tag, such as when its module is reloaded, the new class takes the tag.
+    If the module of the class with the tag is the same file imported under
+    another name, the first class keeps the tag.  A different class with the
+    same tag raises ValueError.
+    """
+    tag = cls.tag
+    if not (isinstance(tag, int) and 1 <= tag <= MAX_TAG):
+        raise ValueError('tag must be an int from 1 to %d' % (MAX_TAG,))
+    old = _tagged.get(tag)
+    if old is not None:
+        if (old.__qualname__ != cls.__qualname__
+                or old.__module__ != cls.__module__
+                and not _same_module_file(old, cls)):
+            raise ValueError('tag %d is already used by %r' % (tag, old))
+        if old.__module__ != cls.__module__:
+            return
+    _tagged[tag] = cls
+
+
+def _same_module_file(a, b):
+    """Return whether classes a and b are defined in the same file."""
+    a_file = getattr(sys.modules.get(a.__module__), '__file__', None)
+    b_file = getattr(sys.modules.get(b.__module__), '__file__', None)
+    return a_file is not None and a_file == b_file
 
-        bases += (tuple,)
-        return super(Constructor, meta).__new__(meta, name, bases, dct)
 
+InternInfo = collections.namedtuple(
+    'InternInfo', 'hits misses evictions maxsize currsize')
 
-def _dict_method_adder(dct):
-    """Decorator for adding methods to a dict."""
-    def decorator(f):
-        dct[f.__name__] = f
-        return f
-    return decorator
+
+def set_interning(cls, maxsize):
+    """Turn interning of a data constructor's values on or off.
+
+    If maxsize is an int, values of cls are kept in an intern table of at
+    most maxsize values, and constructing a value with the same contents as
+    a value in the table returns that value instead.  Contents are the same
+    if they are equal and of the same types.  The least recently used
+    values are evicted from the table when it is full.  Only values whose
+    contents are all ints, bools, strs, bytes or None are interned, since
+    equal values of other types, like 0.0 and -0.0, can differ.
+
+    If maxsize is None, interning is turned off and the table is dropped.
+
+    Interning is turned on when a class is created if it defines an intern
+    class attribute.  Data constructors with an arity of 0 are always
+    singletons and are not affected.
+    """
+    if not cls.arity:
+        return
+    namespace = {'_tuple_new': tuple.__new__}
+    if maxsize is None:
+        exec(_method_code(cls.arity), namespace)
+        cls._intern_table = None
+    else:
+        if maxsize < 1:
+            raise ValueError('maxsize must be positive')
+        table = _InternTable(maxsize)
+        namespace.update(_table=table.values, _stats=table.stats,
+                         _maxsize=maxsize, _interned_types=_INTERNED_TYPES,
+                         _move_to_end=table.values.move_to_end,
+                         _popitem=table.values.popitem)
+        exec(_intern_code(cls.arity), namespace)
+        cls._intern_table = table
+    cls.__new__ = staticmethod(namespace['__new__'])
+
+
+def intern_info(cls):
+    """Return an InternInfo with statistics for the values of cls.
+
+    Raise TypeError if cls does not intern its values.
+    """
+    table = _get_intern_table(cls)
+    hits, misses, evictions = table.stats
+    return InternInfo(hits, misses, evictions, table.maxsize,
+                      len(table.values))
+
+
+def intern_clear(cls):
+    """Clear the interned values and statistics of cls."""
+    table = _get_intern_table(cls)
+    table.values.clear()
+    table.stats[:] = [0, 0, 0]
+
+
+def _get_intern_table(cls):
+    table = cls.__dict__.get('_intern_table')
+    if table is None:
+        raise TypeError('%r does not intern its values' % (cls,))
+    return table
+
+
+class _InternTable:
+
+    """Table of interned values of a data constructor."""
+
+    __slots__ = ('values', 'stats', 'maxsize')
+
+    def __init__(self, maxsize):
+        self.values = collections.OrderedDict()
+        # Hits, misses and evictions.
+        self.stats = [0, 0, 0]
+        self.maxsize = maxsize
+
+
+_METHODS = ('__new__', '__eq__', '__ne__', '__reduce__')
+
+_NULLARY_TEMPLATE = '''\
+def __new__(cls):
+    return _instance
+
+def __eq__(self, other):
+    return self is other
+
+def __ne__(self, other):
+    return self is not other
+
+def __reduce__(self):
+    return (_cls, ())
+
+def __hash__(self):
+    return hash(_cls)
+'''
+
+_TEMPLATE = '''\
+def __new__(cls, {args}):
+    return _tuple_new(cls, ({args},))
+
+def __eq__(self, other):
+    return self is other or (
+        other.__class__ is _cls and _tuple_eq(self, other))
+
+def __ne__(self, other):
+    return not (self is other or (
+        other.__class__ is _cls and _tuple_eq(self, other)))
+
+def __reduce__(self):
+    return (_cls, _tuple_new(tuple, self))
+
+def __hash__(self):
+    return hash((_cls, _tuple_hash(self)))
+'''
+
+# Tuple subclasses cannot have instance slots, so cached hashes are kept by
+# id() and dropped when the value is deallocated.
+_CACHED_HASH_TEMPLATE = '''\
+def __hash__(self):
+    try:
+        return _hashes[id(self)]
+    except KeyError:
+        value = _hashes[id(self)] = hash((_cls, _tuple_hash(self)))
+        return value
+
+def __del__(self):
+    _hashes.pop(id(self), None)
+'''
+
+
+_CACHED_HASH_CODE = compile(
+    _CACHED_HASH_TEMPLATE, '<data.Constructor>', 'exec')
+
+
+# Only contents of these types are interned.  Equal values of other types
+# can still be told apart, like 0.0 and -0.0 or (1,) and (True,).
+_INTERNED_TYPES = frozenset([int, bool, str, bytes, type(None)])
+
+# The types of the contents are part of the key, so that Just(1) and
+# Just(True) are not the same value.  Another thread may evict or clear a
+# key between looking it up and moving it, so KeyError is ignored.
+_INTERN_TEMPLATE = '''\
+def __new__(cls, {args}):
+    if not ({check}):
+        return _tuple_new(cls, ({args},))
+    key = ({args}, {types})
+    value = _table.get(key)
+    if value is not None:
+        try:
+            _move_to_end(key)
+        except KeyError:
+            pass
+        _stats[0] += 1
+        return value
+    _stats[1] += 1
+    value = _table[key] = _tuple_new(cls, ({args},))
+    if len(_table) > _maxsize:
+        try:
+            _popitem(last=False)
+        except KeyError:
+            pass
+        else:
+            _stats[2] += 1
+    return value
+'''
+
+
+@functools.lru_cache(maxsize=None)
+def _intern_code(arity):
+    """Return the compiled code of an interning __new__ for an arity."""
+    args = ', '.join('_%d' % i for i in range(arity))
+    types = ', '.join('_%d.__class__' % i for i in range(arity))
+    check = ' and '.join('_%d.__class__ in _interned_types' % i
+                         for i in range(arity))
+    source = _INTERN_TEMPLATE.format(args=args, types=types, check=check)
+    return compile(source, '<data.Constructor>', 'exec')
+
+
+@functools.lru_cache(maxsize=None)
+def _method_code(arity):
+    """Return the compiled code of the generated methods for an arity."""
+    if arity == 0:
+        source = _NULLARY_TEMPLATE
+    else:
+        args = ', '.join('_%d' % i for i in range(arity))
+        source = _TEMPLATE.format(args=args)
+    return compile(source, '<data.Constructor>', 'exec')
+
+
+def _pop_fields(dct):
+    """Pop the arity or fields class attribute.
+
+    Return a tuple with a name or None for each of the constructor's values.
+    Like namedtuple(), fields may be a string of names separated by spaces
+    or commas.
+    """
+    if 'fields' in dct:
+        fields = dct.pop('fields')
+        if isinstance(fields, str):
+            fields = fields.replace(',', ' ').split()
+        fields = tuple(fields)
+        for field in fields:
+            if not field.isidentifier() or keyword.iskeyword(field):
+                raise ValueError('Invalid field name %r' % (field,))
+        if len(set(fields)) != len(fields):
+            raise ValueError('Duplicate field names %r' % (fields,))
+        if 'arity' in dct and int(dct.pop('arity')) != len(fields):
+            raise TypeError('arity does not match fields')
+        return fields
+    return (None,) * int(dct.pop('arity'))
@@ -0,0 +1,111 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generator based do-notation.
+
+Instead of nesting calls to bind(), write a generator function that yields
+monads.  Each yield gives the value of the monad, like ``<-`` in Haskell's
+do-notation:
+
+    @do
+    def add_inverses(a, b):
+        x = yield invert(a)
+        y = yield invert(b)
+        return Just(x + y)
+
+This is equivalent to:
+
+    def add_inverses(a, b):
+        return invert(a).bind(
+            lambda x: invert(b).bind(
+                lambda y: Just(x + y)))
+
+Just, Identity and Right values are unpacked and Nothing and Left are
+returned in a loop, without calling bind().  When a Nothing or Left is
+yielded, the generator is closed and that monad is returned.  Other
+monads, such as Writer, Free or user defined monads, are bound to a
+function that resumes the generator, so each of them adds a level of
+recursion.
+
+The generator can only be resumed once for each yield, so monads whose
+bind() calls its function more than once, like Stream, raise TypeError.
+
+Functions:
+do -- Decorate a generator function to use do-notation
+run -- Run a do-notation generator
+"""
+
+import functools
+
+import mir.monads.either as either
+import mir.monads.id as id_
+import mir.monads.maybe as maybe
+
+# Monads whose value can be unpacked directly instead of through bind().
+_UNPACKABLE = frozenset([maybe.Just, id_.Identity, either.Right])
+# Monads whose bind() never calls its function.
+_FAILURES = frozenset([maybe.Nothing, either.Left])
+
+
+def do(f):
+    """Decorate a generator function to use do-notation.
+
+    The decorated function returns the monad returned by the generator, or
+    the first yielded monad that short circuits.
+    """
+    @functools.wraps(f)
+    def wrapped(*args, **kwargs):
+        return _resume(f(*args, **kwargs), None)
+    return wrapped
+
+
+def run(generator):
+    """Run a do-notation generator and return the resulting monad."""
+    return _resume(generator, None)
+
+
+def _resume(generator, value):
+    """Resume a do-notation generator with a value."""
+    send = generator.send
+    try:
+        while True:
+            m = send(value)
+            cls = m.__class__
+            if cls in _UNPACKABLE:
+                value, = m
+            elif cls in _FAILURES:
+                generator.close()
+                return m
+            else:
+                return m.bind(_Continuation(generator))
+    except StopIteration as e:
+        return e.value
+
+
+class _Continuation:
+
+    """Function for bind() that resumes a generator once."""
+
+    __slots__ = ('_generator',)
+
+    def __init__(self, generator):
+        self._generator = generator
+
+    def __call__(self, value):
+        generator = self._generator
+        if generator is None:
+            raise TypeError('do-notation does not support monads whose '
+                            'bind() calls its function more than once')
+        self._generator = None
+        return _resume(generator, value)
@@ -0,0 +1,121 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Either monad.
+
+Useful for returning failures as values, keeping the reason for the failure.
+Unlike Maybe, failures do not need to be raised as exceptions, which is much
+faster when failures are common.
+
+Functions:
+monadic -- Decorate a function to return Either
+catching -- Decorate a function to return Either, catching exceptions
+
+Classes:
+Either -- Either monad supertype
+Left -- Either constructor for failures
+Right -- Either constructor for successes
+Failure -- Exception type and message
+"""
+
+import functools
+
+import mir.monads.abc as monads_abc
+import mir.monads.data as data
+
+
+class Either(monads_abc.Monad):
+    """Either monad supertype"""
+
+
+class Left(Either, metaclass=data.Constructor):
+
+    """Left monad"""
+
+    fields = ('value',)
+    tag = 4
+
+    def fmap(self, f):
+        return self
+
+    def apply(self, other):
+        return self
+
+    def bind(self, f):
+        return self
+
+
+class Right(Either, metaclass=data.Constructor):
+
+    """Right monad"""
+
+    fields = ('value',)
+    tag = 5
+
+    def fmap(self, f):
+        value, = self
+        return Right(f(value))
+
+    def apply(self, other):
+        value, = self
+        return other.fmap(value)
+
+    def bind(self, f):
+        value, = self
+        return f(value)
+
+
+class Failure(metaclass=data.Constructor):
+
+    """Exception type and message
+
+    Used as the value of Left by catching().
+    """
+
+    fields = ('type', 'message')
+    tag = 6
+
+
+def monadic(f):
+    """Decorate a unary function to return an Either monad.
+
+    If the function returns Left or Right, it is returned as is.  Otherwise,
+    the return value is wrapped in Right.  Exceptions are not caught.
+    """
+    @functools.wraps(f)
+    def wrapped(a):
+        b = f(a)
+        if b.__class__ is Left or b.__class__ is Right:
+            return b
+        return Right(b)
+    return wrapped
+
+
+def catching(f):
+    """Decorate a unary function to return an Either monad.
+
+    Like monadic(), but exceptions are caught and returned as
+    Left(Failure(type, message)).  Only the exception type and message are
+    kept, so the exception and its traceback can be freed right away.
+    """
+    @functools.wraps(f)
+    def wrapped(a):
+        try:
+            b = f(a)
+        except Exception as e:
+            return Left(Failure(type(e), str(e)))
+        if b.__class__ is Left or b.__class__ is Right:
+            return b
+        return Right(b)
+    return wrapped
@@ -0,0 +1,137 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lightweight abstract base classes for mir.monads package.
+
+The classes in mir.monads.abc use abc.ABCMeta, which makes isinstance()
+checks and class creation slower.  The classes in this module check for
+missing abstract methods when a class is created instead of when it is
+instantiated, so they can use plain type checks.
+
+Classes are concrete unless they are created with ``abstract=True``:
+
+    class Maybe(Monad, abstract=True):
+        pass
+
+    class Just(Maybe, metaclass=Constructor):
+        arity = 1
+        def fmap(self, f): ...
+        def apply(self, other): ...
+        def bind(self, f): ...
+
+Defining a concrete class without all of the abstract methods raises
+TypeError.  The classes here are registered as virtual subclasses of the
+matching classes in mir.monads.abc, so isinstance() checks against those
+still work.  The built in monads use mir.monads.abc, so that they can be
+subclassed with mir.monads.data.Constructor.
+
+Classes:
+Interface -- Metaclass checking abstract methods at class creation
+Constructor -- Data constructor metaclass using Interface
+Functor -- Functor abstract base class
+Applicative -- Applicative abstract base class
+Monad -- Monad abstract base class
+"""
+
+import abc
+
+import mir.monads.abc as monads_abc
+import mir.monads.data as data
+
+
+class Interface(type):
+
+    """Metaclass checking abstract methods at class creation.
+
+    Methods are marked abstract with abc.abstractmethod().
+    """
+
+    def __new__(meta, name, bases, dct, abstract=False):
+        cls = super(Interface, meta).__new__(meta, name, bases, dct)
+        methods = {name for name, value in dct.items()
+                   if getattr(value, '__isabstractmethod__', False)}
+        for base in bases:
+            for method in getattr(base, '_abstract_methods', ()):
+                if getattr(getattr(cls, method), '__isabstractmethod__',
+                           False):
+                    methods.add(method)
+        cls._abstract_methods = frozenset(methods)
+        if methods and not abstract:
+            raise TypeError(
+                "Can't define concrete class %s without abstract methods %s"
+                % (name, ', '.join(sorted(methods))))
+        return cls
+
+    def __init__(cls, name, bases, dct, abstract=False):
+        super(Interface, cls).__init__(name, bases, dct)
+
+
+class Constructor(data.BaseConstructor, Interface):
+
+    """Data constructor metaclass using Interface.
+
+    This works like mir.monads.data.Constructor.
+    """
+
+
+class Functor(metaclass=Interface, abstract=True):
+
+    """Functor supertype
+
+    See mir.monads.abc.Functor.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def fmap(self, f):
+        """Map a function over the functor."""
+        raise NotImplementedError
+
+
+class Applicative(Functor, abstract=True):
+
+    """Applicative supertype
+
+    See mir.monads.abc.Applicative.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def apply(self, other):
+        """Apply this applicative to the other applicative."""
+        raise NotImplementedError
+
+
+class Monad(Applicative, abstract=True):
+
+    """Monad supertype
+
+    See mir.monads.abc.Monad.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def bind(self, f):
+        """Apply the function to the monad."""
+        raise NotImplementedError
+
+    lazy_bind = monads_abc.Monad.lazy_bind
+
+
+monads_abc.Functor.register(Functor)
+monads_abc.Applicative.register(Applicative)
+monads_abc.Monad.register(Monad)
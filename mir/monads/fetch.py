@@ -0,0 +1,295 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fetch monad for batched data fetching.
+
+A Fetch is a computation that requests values by key from data sources,
+like Haxl.  Requests made by independent parts of a computation, such as
+the monads combined with apply() or sequence(), are collected into
+rounds, and each round fetches the keys for each data source with one
+batched call:
+
+    class Users(fetch.DataSource):
+        def fetch(self, keys):
+            return db.get_users(keys)
+
+    users = Users()
+
+    def user_name(user_id):
+        return fetch.request(users, user_id).fmap(lambda user: user.name)
+
+    # Fetches the users in one round with one call to Users.fetch().
+    fetch.run(fetch.traverse(user_name, user_ids))
+
+Values are cached for the run, so a key is fetched at most once.  bind()
+waits for its monad's requests before calling the function, so requests
+that depend on earlier values are made in later rounds.
+
+Functions:
+done -- Make a Fetch of a value
+request -- Make a Fetch of the value for a key from a data source
+sequence -- Combine Fetch monads into a Fetch of a list
+traverse -- Map a function returning Fetch over an iterable
+run -- Run a Fetch and return its value
+
+Classes:
+Fetch -- Fetch monad
+DataSource -- Interface for data sources
+Env -- Cache and statistics for running Fetch monads
+"""
+
+import abc
+
+import mir.monads.abc as monads_abc
+import mir.monads.data as data
+from mir.monads.writer import Log
+
+
+class DataSource(abc.ABC):
+
+    """Interface for data sources."""
+
+    @abc.abstractmethod
+    def fetch(self, keys):
+        """Fetch the values for a list of keys.
+
+        Return a mapping from each key to its value.  The keys are
+        distinct.
+        """
+        raise NotImplementedError
+
+
+class Fetch(monads_abc.Monad):
+
+    """Fetch monad
+
+    A Fetch holds a step function and a queue of continuations.  The step
+    function is called with an Env and returns either the value or the
+    requests the computation is blocked on and the Fetch to continue with
+    once they are fetched.  The value is passed to the queue of
+    continuations, each returning the next Fetch, like Impure in
+    mir.monads.free.
+    """
+
+    __slots__ = ('_step', '_queue')
+
+    def __init__(self, step, queue=None):
+        self._step = step
+        self._queue = queue
+
+    def fmap(self, f):
+        return self.bind(_done_of(f))
+
+    def apply(self, other):
+        def apply_step(env):
+            result = _run_step(self, env)
+            other_result = _run_step(other, env)
+            if result.__class__ is _Done:
+                f, = result
+                if other_result.__class__ is _Done:
+                    value, = other_result
+                    return _Done(f(value))
+                requests, cont = other_result
+                return _Blocked(requests, cont.fmap(f))
+            requests, cont = result
+            if other_result.__class__ is _Done:
+                return _Blocked(requests, cont.apply(_constant(other_result)))
+            other_requests, other_cont = other_result
+            return _Blocked(requests + other_requests,
+                            cont.apply(other_cont))
+        return Fetch(apply_step)
+
+    def bind(self, f):
+        queue = self._queue
+        if queue is None:
+            return Fetch(self._step, f)
+        return Fetch(self._step, (queue, f))
+
+
+def done(value):
+    """Make a Fetch of a value."""
+    return _constant(_Done(value))
+
+
+def request(source, key):
+    """Make a Fetch of the value for a key from a data source."""
+    def read_step(env):
+        return _Done(env.cache[source][key])
+
+    def request_step(env):
+        values = env.cache.get(source)
+        if values is not None and key in values:
+            return _Done(values[key])
+        return _Blocked(Log([(source, key)]), read)
+    read = Fetch(read_step)
+    return Fetch(request_step)
+
+
+def sequence(fetches):
+    """Combine Fetch monads into a Fetch of a list of their values.
+
+    The requests of all of the monads are made in the same rounds.
+    """
+    fetches = list(fetches)
+
+    def sequence_step(env):
+        results = [_run_step(fetch, env) for fetch in fetches]
+        requests = Log()
+        blocked = False
+        for result in results:
+            if result.__class__ is _Blocked:
+                requests = requests + result.requests
+                blocked = True
+        if not blocked:
+            return _Done([value for value, in results])
+        return _Blocked(requests, sequence(
+            _resume(result) for result in results))
+    return Fetch(sequence_step)
+
+
+def traverse(f, iterable):
+    """Map a function returning Fetch over an iterable.
+
+    Return a Fetch of a list of the values.  The requests of all of the
+    items are made in the same rounds.
+    """
+    return sequence(map(f, iterable))
+
+
+class Env:
+
+    """Cache and statistics for running Fetch monads.
+
+    Attributes:
+    cache -- Dict mapping each data source to a dict of fetched values
+    rounds -- Number of rounds of fetching
+    batches -- Number of calls to DataSource.fetch()
+    requests -- Number of keys fetched
+    """
+
+    def __init__(self):
+        self.cache = {}
+        self.rounds = 0
+        self.batches = 0
+        self.requests = 0
+
+    def _fetch_round(self, requests):
+        """Fetch a round of requests."""
+        keys = {}
+        for source, key in requests:
+            keys.setdefault(source, {})[key] = None
+        self.rounds += 1
+        for source, source_keys in keys.items():
+            values = self.cache.setdefault(source, {})
+            source_keys = [key for key in source_keys if key not in values]
+            if not source_keys:
+                continue
+            self.batches += 1
+            self.requests += len(source_keys)
+            values.update(source.fetch(source_keys))
+
+
+def run(fetch, env=None):
+    """Run a Fetch and return its value.
+
+    env is an Env holding the cache and statistics.  By default, a new
+    Env is used for each run.
+    """
+    if env is None:
+        env = Env()
+    while True:
+        result = _run_step(fetch, env)
+        if result.__class__ is _Done:
+            value, = result
+            return value
+        requests, fetch = result
+        env._fetch_round(requests)
+
+
+class _Done(metaclass=data.Constructor):
+
+    """Result of a step that has a value"""
+
+    fields = ('value',)
+    hashable = False
+
+
+class _Blocked(metaclass=data.Constructor):
+
+    """Result of a step that is blocked on requests"""
+
+    fields = ('requests', 'fetch')
+    hashable = False
+
+
+def _run_step(fetch, env):
+    """Run a step of a Fetch and return the result.
+
+    The queue of continuations is either a continuation or a pair of
+    queues, and the leftmost continuation is taken by rotating the pairs
+    like mir.monads.free._resume().  Continuations are run in a loop until
+    a step is blocked, and the rest of the queue is added to the Fetch to
+    continue with, so long chains of binds neither use up the stack nor
+    are stepped again in later rounds.
+    """
+    step = fetch._step
+    queue = fetch._queue
+    while True:
+        result = step(env)
+        if queue is None:
+            return result
+        if result.__class__ is _Blocked:
+            requests, cont = result
+            return _Blocked(
+                requests, Fetch(cont._step, _concat(cont._queue, queue)))
+        value, = result
+        if queue.__class__ is tuple:
+            first, rest = queue
+            while first.__class__ is tuple:
+                first, middle = first
+                rest = (middle, rest)
+        else:
+            first = queue
+            rest = None
+        fetch = first(value)
+        step = fetch._step
+        queue = _concat(fetch._queue, rest)
+
+
+def _concat(first, rest):
+    """Return a queue of continuations running first, then rest."""
+    if first is None:
+        return rest
+    if rest is None:
+        return first
+    return (first, rest)
+
+
+def _done_of(f):
+    def continuation(value):
+        return done(f(value))
+    return continuation
+
+
+def _constant(result):
+    """Return a Fetch whose step always gives result."""
+    return Fetch(lambda env: result)
+
+
+def _resume(result):
+    """Return the Fetch to continue with after a step result."""
+    if result.__class__ is _Done:
+        return _constant(result)
+    requests, fetch = result
+    return fetch
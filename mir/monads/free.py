@@ -0,0 +1,206 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Free monad.
+
+A Free monad describes a workflow as data: a program is either a value
+(Pure) or an effect followed by continuations (Impure).  Effects are
+plain values, such as data constructors, and an interpreter decides
+what they do, so the same program can be run for real, as a dry run or
+in tests:
+
+    class Get(metaclass=data.Constructor):
+        fields = ('key',)
+
+    def program(key):
+        return free.send(Get(key)).fmap(str.upper)
+
+    store = {'a': 'x'}
+    interpreter = free.Interpreter({Get: lambda e: store[e.key]})
+    interpreter.run(program('a')) == 'X'
+
+The continuations of an Impure are kept in a queue that can be appended
+to and concatenated in constant time, so binds take constant time
+however they are nested.  Interpreters run programs in a loop without
+recursion.
+
+Functions:
+send -- Make a program that performs an effect
+run -- Run a program with a handler function
+
+Classes:
+Free -- Free monad supertype
+Pure -- Free monad constructor for values
+Impure -- Free monad constructor for effects
+Interpreter -- Interpreter with handlers for effect types
+"""
+
+import mir.monads.abc as monads_abc
+import mir.monads.data as data
+
+
+class Free(monads_abc.Monad):
+    """Free monad supertype"""
+
+
+class Pure(Free, metaclass=data.Constructor):
+
+    """Program returning a value"""
+
+    fields = ('value',)
+
+    def fmap(self, f):
+        value, = self
+        return Pure(f(value))
+
+    def apply(self, other):
+        value, = self
+        return other.fmap(value)
+
+    def bind(self, f):
+        value, = self
+        return f(value)
+
+
+class Impure(Free, metaclass=data.Constructor):
+
+    """Program performing an effect
+
+    The result of the effect is passed to the queue of continuations.
+    Use send() instead of making these directly.
+    """
+
+    fields = ('effect', 'queue')
+
+    def fmap(self, f):
+        return self.bind(_pure_of(f))
+
+    def apply(self, other):
+        return self.bind(other.fmap)
+
+    def bind(self, f):
+        effect, queue = self
+        if queue is None:
+            return Impure(effect, f)
+        return Impure(effect, (queue, f))
+
+
+def send(effect):
+    """Make a program that performs an effect and returns its result."""
+    return Impure(effect, None)
+
+
+def run(program, handler):
+    """Run a program with a handler function.
+
+    The handler is called with each effect and returns its result.
+    Return the value of the program.
+    """
+    while True:
+        if program.__class__ is Pure:
+            value, = program
+            return value
+        effect, queue = program
+        value = handler(effect)
+        if queue is None:
+            return value
+        program = _resume(queue, value)
+
+
+class Interpreter:
+
+    """Interpreter with handlers for effect types.
+
+    handlers is a mapping from effect types to functions that are called
+    with an effect and return its result.  Effects of subclasses use the
+    handler of the nearest superclass, which is looked up once per type.
+    """
+
+    def __init__(self, handlers):
+        self._handlers = dict(handlers)
+        self._dispatch = dict(handlers)
+
+    def handle(self, effect):
+        """Perform an effect and return its result."""
+        try:
+            handler = self._dispatch[effect.__class__]
+        except KeyError:
+            handler = self._lookup(effect.__class__)
+        return handler(effect)
+
+    def _lookup(self, cls):
+        for base in cls.__mro__:
+            if base in self._handlers:
+                handler = self._handlers[base]
+                self._dispatch[cls] = handler
+                return handler
+        raise TypeError('no handler for effect type %r' % (cls,))
+
+    def run(self, program):
+        """Run a program and return its value."""
+        return run(program, self.handle)
+
+    def compile(self, *steps):
+        """Compile a workflow of steps into a function.
+
+        Each step is a function taking a value and returning a program.
+        The returned function takes an input value, runs each step in
+        turn on the value of the previous one and returns the last value.
+        The steps and handlers are bound once, so the workflow can be run
+        on many inputs without building a chain of binds for each.
+        """
+        handle = self.handle
+        steps = tuple(steps)
+
+        def workflow(value):
+            for step in steps:
+                value = run(step(value), handle)
+            return value
+        return workflow
+
+
+def _pure_of(f):
+    def continuation(value):
+        return Pure(f(value))
+    return continuation
+
+
+def _resume(queue, value):
+    """Pass a value to a queue of continuations and return the program.
+
+    The queue is either a continuation or a pair of queues.  The leftmost
+    continuation is taken by rotating the pairs to the right, which takes
+    amortized constant time.  Continuations returning Pure are run in a
+    loop until one returns an Impure, which gets the rest of the queue.
+    """
+    while True:
+        if queue.__class__ is tuple:
+            first, rest = queue
+            while first.__class__ is tuple:
+                first, middle = first
+                rest = (middle, rest)
+        else:
+            first = queue
+            rest = None
+        program = first(value)
+        if rest is None:
+            return program
+        if program.__class__ is Pure:
+            value, = program
+            queue = rest
+            continue
+        effect, queue = program
+        if queue is None:
+            return Impure(effect, rest)
+        return Impure(effect, (queue, rest))
@@ -16,6 +16,12 @@
 
 Useful for doing something like Clojure's threading operator using fmap().
 
+Functions:
+lift -- Call a function with the values of Identity monads
+map_n -- Map a function over parallel iterables of Identity monads
+traverse -- Map a function returning Identity over an iterable
+sequence -- Turn an iterable of Identity into an Identity of a list
+
 Classes:
 Identity -- Identity monad
 """
@@ -28,7 +34,8 @@ class Identity(monads_abc.Monad, metaclass=data.Constructor):
 
     """Identity monad."""
 
-    arity = 1
+    fields = ('value',)
+    tag = 3
 
     def fmap(self, f):
         value, = self
@@ -41,3 +48,41 @@ class Identity(monads_abc.Monad, metaclass=data.Constructor):
     def bind(self, f):
         value, = self
         return f(value)
+
+
+def lift(f, *identities):
+    """Call a function with the values of Identity monads.
+
+    Return Identity of the result.  This is like Identity(curried
+    f).apply() for each monad, but without the intermediate monads.
+    """
+    return Identity(f(*[value for value, in identities]))
+
+
+def map_n(f, *iterables):
+    """Map a function over parallel iterables of Identity monads.
+
+    Yield lift(f, *identities) for each tuple of monads taken from the
+    iterables in parallel, stopping at the end of the shortest one.
+    """
+    for identities in zip(*iterables):
+        yield Identity(f(*[value for value, in identities]))
+
+
+def traverse(f, iterable, executor=None, chunksize=256):
+    """Map a function returning Identity over an iterable.
+
+    Return Identity of a list of the values.  If a concurrent.futures
+    executor is given, the function is mapped in parallel with
+    executor.map(), passing chunksize along.  The values are in order.
+    """
+    if executor is None:
+        results = map(f, iterable)
+    else:
+        results = executor.map(f, iterable, chunksize=chunksize)
+    return sequence(results)
+
+
+def sequence(monads):
+    """Turn an iterable of Identity monads into an Identity of a list."""
+    return Identity([value for value, in monads])
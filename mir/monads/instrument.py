@@ -0,0 +1,204 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runtime instrumentation of monad operations.
+
+Instrumentation is off by default and costs nothing until enabled.
+enable() replaces the fmap(), apply() and bind() methods of monad classes,
+and the constructors of data constructor classes, with wrappers that
+collect statistics.  disable() puts the original methods back.
+
+    instrument.enable()
+    run_pipeline()
+    metrics.send(instrument.snapshot())
+
+The following statistics are kept for each class:
+
+calls -- Number of fmap(), apply() and bind() calls, including calls
+    that raised exceptions
+short_circuits -- Number of calls on a success that returned a failure,
+    such as Just.fmap() returning Nothing
+constructions -- Number of values constructed (for classes with an arity
+    of 0, this counts calls returning the single instance)
+time -- For each method, the call count, the total time in nanoseconds,
+    including the time spent in the function passed to the method, and a
+    histogram of call times with power of two buckets
+
+Counts are not locked, so they may be slightly low for calls made from
+several threads at once.
+
+Functions:
+enable -- Start instrumenting monad classes
+disable -- Stop instrumenting all classes
+snapshot -- Return the statistics as a dict
+reset -- Clear the statistics
+"""
+
+import functools
+import time
+
+import mir.monads.data as data
+import mir.monads.either as either
+import mir.monads.id as id_
+import mir.monads.maybe as maybe
+
+DEFAULT_CLASSES = (maybe.Just, maybe.Nothing, id_.Identity,
+                   either.Left, either.Right)
+DEFAULT_FAILURES = (maybe.Nothing, either.Left)
+
+_METHODS = ('fmap', 'apply', 'bind')
+# Histogram bucket i counts calls that took less than 2 ** i nanoseconds.
+# The last bucket counts all slower calls.
+_BUCKETS = 33
+
+_originals = {}
+_stats = {}
+_failures = set()
+
+
+class _Stats:
+
+    """Statistics for one class."""
+
+    __slots__ = ('calls', 'short_circuits', 'constructions', 'times',
+                 'totals', 'histograms')
+
+    def __init__(self):
+        self.calls = dict.fromkeys(_METHODS, 0)
+        self.short_circuits = 0
+        self.constructions = 0
+        self.totals = dict.fromkeys(_METHODS, 0)
+        self.histograms = {method: [0] * _BUCKETS for method in _METHODS}
+
+    def clear(self):
+        """Zero the statistics in place.
+
+        Instrumented methods hold references to the dicts and lists, so
+        they must not be replaced.
+        """
+        self.short_circuits = 0
+        self.constructions = 0
+        for method in _METHODS:
+            self.calls[method] = 0
+            self.totals[method] = 0
+            self.histograms[method][:] = [0] * _BUCKETS
+
+    def as_dict(self):
+        return {
+            'calls': dict(self.calls),
+            'short_circuits': self.short_circuits,
+            'constructions': self.constructions,
+            'time': {
+                method: {
+                    'count': self.calls[method],
+                    'total_ns': self.totals[method],
+                    'histogram': list(self.histograms[method]),
+                }
+                for method in _METHODS
+            },
+        }
+
+
+def enable(classes=DEFAULT_CLASSES, failures=DEFAULT_FAILURES):
+    """Start instrumenting monad classes.
+
+    classes is an iterable of monad classes to instrument.  failures is an
+    iterable of classes whose values count as failures for short circuit
+    statistics.  Classes that are already instrumented are skipped.
+    """
+    _failures.update(failures)
+    for cls in classes:
+        if cls in _originals:
+            continue
+        stats = _stats.setdefault(cls, _Stats())
+        originals = {}
+        for method in _METHODS:
+            if method in cls.__dict__:
+                originals[method] = cls.__dict__[method]
+                setattr(cls, method,
+                        _wrap_method(cls, method, originals[method], stats))
+        if isinstance(cls, data.BaseConstructor):
+            originals['__new__'] = cls.__dict__['__new__']
+            cls.__new__ = staticmethod(
+                _wrap_new(originals['__new__'].__func__, stats))
+        _originals[cls] = originals
+
+
+def disable():
+    """Stop instrumenting all classes.
+
+    The statistics are kept until reset() is called.
+    """
+    for cls, originals in _originals.items():
+        for name, original in originals.items():
+            setattr(cls, name, original)
+    _originals.clear()
+    _failures.clear()
+
+
+def snapshot():
+    """Return the statistics as a dict.
+
+    The keys are the qualified names of the classes.  The dict can be
+    serialized as JSON.
+    """
+    return {
+        'histogram_bounds_ns': [2 ** i for i in range(_BUCKETS - 1)],
+        'classes': {
+            '%s.%s' % (cls.__module__, cls.__qualname__): stats.as_dict()
+            for cls, stats in _stats.items()
+        },
+    }
+
+
+def reset():
+    """Clear the statistics."""
+    for cls in list(_stats):
+        if cls in _originals:
+            _stats[cls].clear()
+        else:
+            del _stats[cls]
+
+
+def _wrap_method(cls, method, f, stats):
+    """Return an instrumented version of a monad method."""
+    failure = cls in _failures
+    calls = stats.calls
+    totals = stats.totals
+    histogram = stats.histograms[method]
+    # time.perf_counter_ns() needs Python 3.7.
+    perf_counter = time.perf_counter
+    last_bucket = _BUCKETS - 1
+
+    @functools.wraps(f)
+    def wrapped(self, arg):
+        calls[method] += 1
+        start = perf_counter()
+        result = f(self, arg)
+        elapsed = int((perf_counter() - start) * 1e9)
+        totals[method] += elapsed
+        histogram[min(elapsed.bit_length(), last_bucket)] += 1
+        if not failure and result.__class__ in _failures:
+            stats.short_circuits += 1
+        return result
+    return wrapped
+
+
+def _wrap_new(f, stats):
+    """Return an instrumented version of a data constructor's __new__."""
+    @functools.wraps(f)
+    def __new__(cls, *args):
+        stats.constructions += 1
+        return f(cls, *args)
+    return __new__
@@ -18,14 +18,33 @@ Useful for replacing the awful None type in Python.
 
 Functions:
 monadic -- Decorate a function to return Maybe
+cached_monadic -- Decorate a function to return Maybe with a cache
+lift -- Call a function with the values of Maybe monads
+map_n -- Map a function over parallel iterables of Maybe monads
+map_maybe -- Map a function over an iterable, skipping failures
+map_maybe_chunks -- Chunked version of map_maybe()
+cat_maybes -- Yield the values of Just in an iterable of Maybe
+partition_maybes -- Split successes and failures of a function
+traverse -- Map a function returning Maybe over an iterable
+sequence -- Turn an iterable of Maybe into a Maybe of a list
+traverse_into -- Like traverse(), but pass the values to a callback
+sequence_into -- Like sequence(), but pass the values to a callback
+fold_m -- Fold a function returning Maybe over an iterable
 
 Classes:
 Maybe -- Maybe monad supertype
 Just -- Maybe constructor
 Nothing -- Maybe constructor
+CacheInfo -- Statistics for cached_monadic()
 """
 
+import collections
 import functools
+import itertools
+import os
+import threading
+import time
+import weakref
 
 import mir.monads.abc as monads_abc
 import mir.monads.data as data
@@ -39,16 +58,21 @@ class Just(Maybe, metaclass=data.Constructor):
 
     """Just monad"""
 
-    arity = 1
+    fields = ('value',)
+    tag = 2
 
     def fmap(self, f):
         value, = self
         try:
             new_value = f(value)
-        except Exception:
-            new_value = None
+        except Exception as e:
+            if _trace is not None:
+                _trace(f, value, e)
+            return _nothing
         if new_value is None:
-            return Nothing()
+            if _trace is not None:
+                _trace(f, value, None)
+            return _nothing
         else:
             return Just(new_value)
 
@@ -66,15 +90,28 @@ class Nothing(Maybe, metaclass=data.Constructor):
     """Nothing monad"""
 
     arity = 0
+    tag = 1
 
     def fmap(self, f):
-        return Nothing()
+        return self
 
     def apply(self, other):
-        return Nothing()
+        return self
 
     def bind(self, f):
-        return Nothing()
+        return self
+
+
+_nothing = Nothing()
+
+# Function called with the function, input and exception or None when a
+# function gives Nothing, set by mir.monads.trace.
+_trace = None
+
+
+# Functions decorated by monadic(), mapped to the undecorated functions, so
+# that pipelines can call the undecorated functions directly.
+_monadic_functions = weakref.WeakKeyDictionary()
 
 
 def monadic(f):
@@ -83,10 +120,355 @@ def monadic(f):
     def wrapped(a):
         try:
             b = f(a)
-        except Exception:
-            b = None
+        except Exception as e:
+            if _trace is not None:
+                _trace(f, a, e)
+            return _nothing
         if b is None:
-            return Nothing()
+            if _trace is not None:
+                _trace(f, a, None)
+            return _nothing
         else:
             return Just(b)
+    _monadic_functions[wrapped] = f
     return wrapped
+
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', 'hits misses evictions maxsize currsize')
+
+
+def cached_monadic(maxsize=128, ttl=None, policy='lru', timer=time.monotonic):
+    """Decorate a unary function to return a cached Maybe monad.
+
+    Like monadic(), but results are cached by argument, including Nothing
+    results, so a failing call is not repeated either.  Arguments must be
+    hashable.
+
+    maxsize is the largest number of cached results, or None for no limit.
+    ttl is the number of seconds results are kept for, or None to keep them
+    until evicted.  policy decides which result is evicted when the cache is
+    full: 'lru' evicts the least recently used and 'fifo' the oldest.  timer
+    is the clock used for ttl.
+
+    The decorated function can be called from several threads.  It has the
+    following methods:
+
+    cache_info -- Return a CacheInfo of statistics
+    cache_clear -- Remove all results and reset the statistics
+    invalidate -- Remove the result for an argument
+    """
+    if policy not in ('lru', 'fifo'):
+        raise ValueError('Unknown policy %r' % (policy,))
+
+    def decorator(f):
+        cached = _CachedMonadic(monadic(f), maxsize, ttl, policy == 'lru',
+                                timer)
+        return functools.update_wrapper(cached, f)
+    return decorator
+
+
+class _CachedMonadic:
+
+    """Function wrapper for cached_monadic()."""
+
+    def __init__(self, f, maxsize, ttl, lru, timer):
+        self._f = f
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lru = lru
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._cache = collections.OrderedDict()
+        self._hits = self._misses = self._evictions = 0
+
+    def __call__(self, a):
+        with self._lock:
+            entry = self._cache.get(a)
+            if entry is not None:
+                result, expires = entry
+                if expires is None or self._timer() < expires:
+                    self._hits += 1
+                    if self._lru:
+                        self._cache.move_to_end(a)
+                    return result
+                del self._cache[a]
+                self._evictions += 1
+            self._misses += 1
+        result = self._f(a)
+        expires = None if self._ttl is None else self._timer() + self._ttl
+        with self._lock:
+            self._cache[a] = (result, expires)
+            self._cache.move_to_end(a)
+            if self._maxsize is not None:
+                while len(self._cache) > self._maxsize:
+                    self._cache.popitem(last=False)
+                    self._evictions += 1
+        return result
+
+    def cache_info(self):
+        """Return a CacheInfo of cache statistics."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             self._maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """Remove all cached results and reset the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def invalidate(self, a):
+        """Remove the cached result for an argument.
+
+        Return whether there was a cached result.
+        """
+        with self._lock:
+            return self._cache.pop(a, None) is not None
+
+
+def lift(f, *maybes):
+    """Call a function with the values of Maybe monads.
+
+    Return Nothing if any monad is Nothing.  Otherwise, call f once with
+    the values and return the result following the same rules as
+    monadic().  This is like Just(curried f).apply() for each monad, but
+    without the intermediate monads and partial functions.
+    """
+    try:
+        # Unpacking Nothing raises ValueError.
+        values = [value for value, in maybes]
+    except ValueError:
+        return _nothing
+    try:
+        b = f(*values)
+    except Exception as e:
+        if _trace is not None:
+            _trace(f, tuple(values), e)
+        return _nothing
+    if b is None:
+        if _trace is not None:
+            _trace(f, tuple(values), None)
+        return _nothing
+    return Just(b)
+
+
+def map_n(f, *iterables):
+    """Map a function over parallel iterables of Maybe monads.
+
+    Yield lift(f, *maybes) for each tuple of monads taken from the
+    iterables in parallel, stopping at the end of the shortest one.
+    """
+    for maybes in zip(*iterables):
+        try:
+            values = [value for value, in maybes]
+        except ValueError:
+            yield _nothing
+            continue
+        try:
+            b = f(*values)
+        except Exception as e:
+            if _trace is not None:
+                _trace(f, tuple(values), e)
+            yield _nothing
+            continue
+        if b is None:
+            if _trace is not None:
+                _trace(f, tuple(values), None)
+            yield _nothing
+        else:
+            yield Just(b)
+
+
+def map_maybe(f, iterable):
+    """Map a unary function over an iterable, skipping failures.
+
+    Yield f(a) for each item a.  Items for which f returns None or raises an
+    exception are skipped, following the same rules as monadic().  This is
+    equivalent to cat_maybes(map(monadic(f), iterable)), but no Maybe monads
+    are created.
+    """
+    for a in iterable:
+        try:
+            b = f(a)
+        except Exception:
+            continue
+        if b is not None:
+            yield b
+
+
+def map_maybe_chunks(f, iterable, size):
+    """Map a unary function over an iterable in chunks, skipping failures.
+
+    Like map_maybe(), but yield lists of the results for each chunk of size
+    items.  Chunks where every item fails yield empty lists.
+    """
+    for chunk in _chunks(iterable, size):
+        yield list(map_maybe(f, chunk))
+
+
+def cat_maybes(maybes):
+    """Yield the values of the Just monads in an iterable of Maybe monads."""
+    for m in maybes:
+        if m is not _nothing:
+            value, = m
+            yield value
+
+
+def partition_maybes(f, iterable):
+    """Split the successes and failures of a unary function.
+
+    Return a pair of iterators.  The first yields f(a) for the items where f
+    succeeds, like map_maybe().  The second yields the items a for which f
+    returns None or raises an exception.  f is called once for each item.
+
+    Items are buffered until both iterators have seen them, so consume the
+    iterators alternately to keep memory use constant.
+    """
+    first, second = itertools.tee(_tag_results(f, iterable))
+    return ((b for ok, b in first if ok),
+            (a for ok, a in second if not ok))
+
+
+def _tag_results(f, iterable):
+    """Yield (True, f(a)) for successes and (False, a) for failures."""
+    for a in iterable:
+        try:
+            b = f(a)
+        except Exception:
+            yield False, a
+            continue
+        if b is None:
+            yield False, a
+        else:
+            yield True, b
+
+
+def traverse(f, iterable, executor=None, chunksize=256):
+    """Map a function returning Maybe over an iterable.
+
+    Return Just a list of the values if f returns Just for every item, else
+    Nothing.  Items are processed in order and processing stops at the
+    first Nothing.
+
+    If a concurrent.futures executor is given, the items are split into
+    chunks of chunksize items, which are processed in parallel.  Only
+    twice as many chunks as the executor has workers are submitted at a
+    time, and more are read from the iterable as they finish.  When a
+    chunk gives Nothing, the submitted chunks that have not started yet
+    are cancelled and the rest of the iterable is not read.  The values in
+    the result are still in order.  For process pools, f must be
+    picklable, such as a module level function decorated with monadic().
+    """
+    if executor is None:
+        values = _traverse_chunk(f, iterable)
+        return _nothing if values is None else Just(values)
+    # concurrent.futures is slow to import, so only import it when needed.
+    import concurrent.futures
+    chunks = enumerate(_chunks(iterable, chunksize))
+    # Executors do not expose their number of workers publicly.
+    workers = getattr(executor, '_max_workers', None) or os.cpu_count() or 1
+    pending = {}
+    results = {}
+    try:
+        for i, chunk in itertools.islice(chunks, 2 * workers):
+            pending[executor.submit(_traverse_chunk, f, chunk)] = i
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                values = future.result()
+                if values is None:
+                    return _nothing
+                results[pending.pop(future)] = values
+            for i, chunk in itertools.islice(chunks, len(done)):
+                pending[executor.submit(_traverse_chunk, f, chunk)] = i
+    finally:
+        for future in pending:
+            future.cancel()
+    return Just([value for i in range(len(results)) for value in results[i]])
+
+
+def sequence(maybes):
+    """Turn an iterable of Maybe monads into a Maybe of a list.
+
+    Return Just a list of the values if every monad is Just, else Nothing.
+    The iterable is not consumed past the first Nothing.
+    """
+    values = []
+    for m in maybes:
+        if m is _nothing:
+            return m
+        value, = m
+        values.append(value)
+    return Just(values)
+
+
+def traverse_into(f, iterable, callback):
+    """Map a function returning Maybe over an iterable, streaming values.
+
+    Like traverse() without an executor, but call callback with each value
+    as soon as it is made instead of collecting them in a list, so memory
+    use does not grow with the iterable.  Return Just the number of values
+    if f returns Just for every item, else Nothing.  Values before the
+    first Nothing have already been passed to callback.
+    """
+    return sequence_into(map(f, iterable), callback)
+
+
+def sequence_into(maybes, callback):
+    """Pass the values of an iterable of Maybe monads to a callback.
+
+    Like sequence(), but call callback with each value instead of
+    collecting them in a list.  Return Just the number of values if every
+    monad is Just, else Nothing.  The iterable is not consumed past the
+    first Nothing.
+    """
+    count = 0
+    for m in maybes:
+        if m is _nothing:
+            return m
+        value, = m
+        callback(value)
+        count += 1
+    return Just(count)
+
+
+def fold_m(f, initial, iterable):
+    """Fold a function returning Maybe over an iterable.
+
+    f is called with the accumulated value, starting with initial, and
+    each item, and returns Maybe the next accumulated value.  Return Just
+    the final value, or Nothing as soon as f returns Nothing, without
+    consuming the rest of the iterable.  This is Haskell's foldM, run in a
+    loop instead of with nested binds.
+    """
+    acc = initial
+    for a in iterable:
+        m = f(acc, a)
+        if m is _nothing:
+            return m
+        acc, = m
+    return Just(acc)
+
+
+def _traverse_chunk(f, items):
+    """Return a list of the values of f for items, or None for Nothing."""
+    values = []
+    for a in items:
+        m = f(a)
+        if m is _nothing:
+            return None
+        value, = m
+        values.append(value)
+    return values
+
+
+def _chunks(iterable, size):
+    """Yield lists of size items from an iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,209 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Columnar Maybe monad backed by NumPy.
+
+This module requires NumPy.
+
+Classes:
+MaybeArray -- Array of Maybe values
+"""
+
+import numpy
+
+import mir.monads.abc as monads_abc
+import mir.monads.maybe as maybe
+
+
+class MaybeArray(monads_abc.Monad):
+
+    """Array of Maybe values
+
+    A MaybeArray holds a NumPy array of values and a boolean array marking
+    which of the values are valid.  Valid slots stand for Just(value) and
+    invalid slots stand for Nothing().
+
+    Functions given to fmap() and bind() are vectorized: they are called
+    once with an array of all of the valid values.
+    """
+
+    __slots__ = ('values', 'mask')
+
+    def __init__(self, values, mask=None):
+        self.values = numpy.asarray(values)
+        if mask is None:
+            mask = _valid(self.values)
+        self.mask = numpy.asarray(mask, dtype=bool)
+        if self.values.shape != self.mask.shape or self.values.ndim != 1:
+            raise ValueError('values and mask must be 1-d and the same shape')
+
+    @classmethod
+    def from_values(cls, values):
+        """Make a MaybeArray from an iterable of plain values.
+
+        None and NaN values become invalid slots.
+        """
+        values = list(values)
+        mask = numpy.array([value is not None for value in values],
+                           dtype=bool)
+        return cls._scatter(
+            mask, _array([value for value in values if value is not None]))
+
+    @classmethod
+    def from_maybes(cls, maybes):
+        """Make a MaybeArray from an iterable of Maybe values."""
+        return cls.from_values(
+            m.value if isinstance(m, maybe.Just) else None for m in maybes)
+
+    def to_maybes(self):
+        """Return a list of Maybe values."""
+        return list(self)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        nothing = maybe.Nothing()
+        for value, valid in zip(self.values.tolist(), self.mask.tolist()):
+            yield maybe.Just(value) if valid else nothing
+
+    def __getitem__(self, index):
+        if not self.mask[index]:
+            return maybe.Nothing()
+        value = self.values[index]
+        if isinstance(value, numpy.generic):
+            value = value.item()
+        return maybe.Just(value)
+
+    def __repr__(self):
+        return 'MaybeArray(%r, %r)' % (self.values, self.mask)
+
+    def fmap(self, f):
+        """Map a vectorized function over the valid values.
+
+        Slots where the result is None or NaN become invalid.  NumPy
+        floating point errors such as division by zero do not raise; if any
+        happen, infinite results become invalid too.  If the function
+        raises for the whole array, it is called on each value separately
+        instead, and the slots where it raises become invalid, like
+        Just.fmap().
+        """
+        values = self.values[self.mask]
+        errors = []
+        try:
+            with numpy.errstate(
+                    all='call', call=lambda kind, flag: errors.append(kind)):
+                result = numpy.asarray(f(values))
+            if result.shape != values.shape:
+                raise ValueError('function changed the shape of the values')
+        except Exception:
+            return self._fmap_each(f, values)
+        mask = _valid(result)
+        if errors and result.dtype.kind in 'fc':
+            mask &= numpy.isfinite(result)
+        return self._scatter_valid(result, mask)
+
+    def apply(self, other):
+        """Apply the functions in this array to the values in the other.
+
+        Each function is called separately, like Just.apply().
+        """
+        result = [a.apply(b) for a, b in zip(self, other)]
+        return type(self).from_maybes(result)
+
+    def bind(self, f):
+        """Bind a vectorized function over the valid values.
+
+        The function is called with an array of the valid values and must
+        return a MaybeArray of the same length.
+        """
+        result = f(self.values[self.mask])
+        if len(result) != self.mask.sum():
+            raise ValueError('function changed the shape of the values')
+        return self._scatter_valid(result.values, result.mask)
+
+    def _fmap_each(self, f, values):
+        """Map a function over each of the values like Just.fmap()."""
+        result = []
+        with _raise_float_errors():
+            for value in values.tolist():
+                try:
+                    result.append(f(value))
+                except Exception:
+                    result.append(None)
+        result = type(self).from_values(result)
+        return self._scatter_valid(result.values, result.mask)
+
+    def _scatter_valid(self, values, mask):
+        """Return a MaybeArray with values put in the valid slots."""
+        new_values = numpy.zeros(len(self), dtype=values.dtype)
+        new_values[self.mask] = values
+        new_mask = self.mask.copy()
+        new_mask[self.mask] = mask
+        return type(self)(new_values, new_mask)
+
+    @classmethod
+    def _scatter(cls, mask, valid):
+        """Return a MaybeArray with valid values put where mask is true.
+
+        NaN values are marked invalid.
+        """
+        values = numpy.zeros(len(mask), dtype=valid.dtype)
+        values[mask] = valid
+        mask = mask.copy()
+        mask[mask] = _valid(valid)
+        return cls(values, mask)
+
+
+def _array(items):
+    """Return a 1-d array of items, using the object dtype if needed.
+
+    NumPy converts items of mixed types to one type, such as 1 and 'a' to
+    strings, so the object dtype is used unless the items keep their types.
+    """
+    try:
+        array = numpy.array(items)
+    except ValueError:
+        array = None
+    if (array is None or array.ndim != 1
+            or (array.dtype.kind != 'O'
+                and not _same_types(items, array.tolist()))):
+        array = numpy.empty(len(items), dtype=object)
+        for i, item in enumerate(items):
+            array[i] = item
+    return array
+
+
+def _same_types(items, converted):
+    """Return whether items have the same types after conversion."""
+    for item, new in zip(items, converted):
+        if type(item) is not type(new) and not isinstance(item,
+                                                          numpy.generic):
+            return False
+    return True
+
+
+def _valid(values):
+    """Return a boolean array marking values that are not None or NaN."""
+    if values.dtype.kind in 'fc':
+        return ~numpy.isnan(values)
+    if values.dtype.kind == 'O':
+        return numpy.array([value is not None for value in values.tolist()],
+                           dtype=bool).reshape(values.shape)
+    return numpy.ones(values.shape, dtype=bool)
+
+
+def _raise_float_errors():
+    """Return a context manager that raises NumPy floating point errors."""
+    return numpy.errstate(divide='raise', invalid='raise', over='raise')
@@ -0,0 +1,191 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fused pipelines of fmap() and bind() calls.
+
+A pipeline records a chain of fmap() and bind() calls and compiles it into
+a single function.  The compiled function gives the same result as calling
+the methods one by one on a monad, but does not create the monads in
+between, so it is much faster for running the same chain over many values:
+
+    parse = MaybePipeline().fmap(str.strip).fmap(int).bind(check_positive)
+    parse('  1 ') == Just(1).fmap(str.strip).fmap(int).bind(check_positive)
+    results = list(parse.run_many(lines))
+
+Pipelines are also Kleisli arrows, functions from a value to a monad, and
+compose() composes them:
+
+    parse = MaybePipeline.compose(strip_line, parse_int, check_positive)
+    parse('  1 ') == strip_line('  1 ').bind(parse_int).bind(check_positive)
+
+Classes:
+IdentityPipeline -- Fused pipeline for the Identity monad
+MaybePipeline -- Fused pipeline for the Maybe monad
+"""
+
+import mir.monads.id as id_
+import mir.monads.maybe as maybe
+
+
+class _Pipeline:
+
+    """Pipeline supertype
+
+    Pipelines are immutable.  fmap() and bind() return new pipelines, so a
+    pipeline can be extended in several ways.
+    """
+
+    __slots__ = ('_stages', '_compiled')
+
+    _unit = None
+
+    def __init__(self, stages=()):
+        self._stages = tuple(stages)
+        self._compiled = None
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self._stages)
+
+    def fmap(self, f):
+        """Return a pipeline with an fmap() call added."""
+        return type(self)(self._stages + (('fmap', f),))
+
+    def bind(self, f):
+        """Return a pipeline with a bind() call added.
+
+        If f is a pipeline of the same type, its stages are added instead,
+        so composed pipelines are flat.
+        """
+        if type(f) is type(self):
+            return type(self)(self._stages + f._stages)
+        return type(self)(self._stages + (self._bind_stage(f),))
+
+    @classmethod
+    def compose(cls, *functions):
+        """Return the Kleisli composition of functions as a pipeline.
+
+        The functions take a value and return a monad, and may be
+        pipelines.  Calling the pipeline on a value x gives the same result
+        as functions[0](x).bind(functions[1]).bind(functions[2]) and so on.
+        """
+        pipeline = cls()
+        for f in functions:
+            pipeline = pipeline.bind(f)
+        return pipeline
+
+    def compile(self):
+        """Return the pipeline compiled into a function.
+
+        The function takes a value and returns the monad that running the
+        pipeline on unit(value) would return.  The function is compiled
+        once and cached.
+        """
+        if self._compiled is None:
+            namespace = {'_unit': self._unit}
+            lines = ['def run(x):']
+            for i, (method, f) in enumerate(self._stages):
+                namespace['_f%d' % i] = f
+                lines.extend('    ' + line for line
+                             in self._stage_source(i, method))
+            if not self._stages or self._stages[-1][0] != 'bind':
+                lines.append('    return _unit(x)')
+            namespace.update(self._namespace())
+            exec('\n'.join(lines), namespace)
+            self._compiled = namespace['run']
+        return self._compiled
+
+    def __call__(self, value):
+        """Run the pipeline on a value."""
+        return self.compile()(value)
+
+    def run_many(self, values):
+        """Return an iterator running the pipeline on each of the values."""
+        return map(self.compile(), values)
+
+    def _bind_stage(self, f):
+        """Return the stage for a bind() call."""
+        return ('bind', f)
+
+    def _namespace(self):
+        """Return the extra globals for the compiled function."""
+        return {}
+
+    def _stage_source(self, i, method):
+        """Return the source lines for a stage of the compiled function."""
+        raise NotImplementedError
+
+
+class IdentityPipeline(_Pipeline):
+
+    """Fused pipeline for the Identity monad"""
+
+    __slots__ = ()
+
+    _unit = id_.Identity
+
+    def _stage_source(self, i, method):
+        if method == 'fmap':
+            return ['x = _f%d(x)' % i]
+        if i == len(self._stages) - 1:
+            return ['return _f%d(x)' % i]
+        return ['x, = _f%d(x)' % i]
+
+
+class MaybePipeline(_Pipeline):
+
+    """Fused pipeline for the Maybe monad
+
+    fmap() stages turn None and exceptions into Nothing like Just.fmap(),
+    and trace the failure if tracing is on.  Nothing from a bind() stage
+    skips the rest of the pipeline.
+
+    Binding a function decorated with maybe.monadic() adds an fmap() stage
+    of the undecorated function instead, which gives the same result
+    without making a Just.
+    """
+
+    __slots__ = ()
+
+    _unit = maybe.Just
+
+    def _bind_stage(self, f):
+        try:
+            return ('fmap', maybe._monadic_functions[f])
+        except (KeyError, TypeError):
+            return ('bind', f)
+
+    def _namespace(self):
+        return {'_nothing': maybe.Nothing(), '_maybe': maybe}
+
+    def _stage_source(self, i, method):
+        # Failures are traced like Just.fmap().  maybe._trace is looked up
+        # only on failure, since it changes when tracing is turned on.
+        if method == 'fmap':
+            return ['try:',
+                    '    y = _f%d(x)' % i,
+                    'except Exception as e:',
+                    '    if _maybe._trace is not None:',
+                    '        _maybe._trace(_f%d, x, e)' % i,
+                    '    return _nothing',
+                    'if y is None:',
+                    '    if _maybe._trace is not None:',
+                    '        _maybe._trace(_f%d, x, None)' % i,
+                    '    return _nothing',
+                    'x = y']
+        if i == len(self._stages) - 1:
+            return ['return _f%d(x)' % i]
+        return ['m = _f%d(x)' % i,
+                'if m is _nothing:',
+                '    return m',
+                'x, = m']
@@ -0,0 +1,175 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy List monad.
+
+The List monad represents non-deterministic computations, such as
+searches: a Stream holds any number of results, and binding a Stream
+calls the function on each result and concatenates the Streams it
+returns.
+
+    def triples(n):
+        return Stream(range(1, n)).bind(
+            lambda a: Stream(range(a, n)).bind(
+                lambda b: Stream(range(b, n)).bind(
+                    lambda c: guard(a * a + b * b == c * c).fmap(
+                        lambda _: (a, b, c)))))
+
+    triples(20).first() == Just((3, 4, 5))
+
+Streams are lazy: results are computed only when the Stream is
+iterated, one at a time, so a search holds one partial result for each
+bind instead of every intermediate result.  Stream sources may be
+infinite, in which case take() and first() can be used to stop early,
+and fair_bind() and interleave() to keep infinite branches from
+starving the others.
+
+Functions:
+guard -- Make a Stream that continues a search if a condition holds
+
+Classes:
+Stream -- Lazy List monad
+"""
+
+import itertools
+
+import mir.monads.abc as monads_abc
+import mir.monads.data as data
+import mir.monads.maybe as maybe
+
+
+class Stream(monads_abc.Monad, metaclass=data.Constructor):
+
+    """Lazy List monad.
+
+    The iterable must be iterable more than once if the Stream is
+    iterated more than once.  Streams made by methods can be.
+    """
+
+    fields = ('iterable',)
+    hashable = False
+
+    def fmap(self, f):
+        iterable, = self
+        return Stream(_Lazy(map, f, iterable))
+
+    def apply(self, other):
+        iterable, = self
+        return Stream(_Lazy(_apply, iterable, other.iterable))
+
+    def bind(self, f):
+        iterable, = self
+        return Stream(_Lazy(_bind, iterable, f))
+
+    def fair_bind(self, f):
+        """Like bind(), but interleave the results of the Streams."""
+        iterable, = self
+        return Stream(_Lazy(_fair_bind, iterable, f))
+
+    def plus(self, other):
+        """Return the results of this Stream followed by other."""
+        iterable, = self
+        return Stream(_Lazy(itertools.chain, iterable, other.iterable))
+
+    def interleave(self, other):
+        """Return the results of this Stream and other alternately."""
+        iterable, = self
+        return Stream(_Lazy(_interleave, (iterable, other.iterable)))
+
+    def take(self, n):
+        """Return a Stream of the first n results."""
+        iterable, = self
+        return Stream(_Lazy(itertools.islice, iterable, n))
+
+    def first(self):
+        """Return Just the first result, or Nothing if there is none."""
+        iterable, = self
+        for value in iterable:
+            return maybe.Just(value)
+        return maybe.Nothing()
+
+
+def guard(condition):
+    """Make a Stream that continues a search if a condition holds.
+
+    Return a Stream with one result, None, if condition is true, else an
+    empty Stream.
+    """
+    return _unit if condition else _empty
+
+
+_unit = Stream((None,))
+_empty = Stream(())
+
+
+class _Lazy:
+
+    """Iterable that calls a function to make each iterator."""
+
+    __slots__ = ('_func', '_args')
+
+    def __init__(self, func, *args):
+        self._func = func
+        self._args = args
+
+    def __iter__(self):
+        return iter(self._func(*self._args))
+
+
+def _apply(functions, iterable):
+    for f in functions:
+        yield from map(f, iterable)
+
+
+def _bind(iterable, f):
+    for value in iterable:
+        yield from f(value).iterable
+
+
+def _fair_bind(iterable, f):
+    """Yield the results of f on each value of iterable, diagonally.
+
+    Each round takes the next value of iterable and then one result from
+    each of the Streams so far, so every result is reached even if
+    iterable and the Streams are infinite.
+    """
+    source = iter(iterable)
+    iterators = []
+    while True:
+        if source is not None:
+            for value in source:
+                iterators.append(iter(f(value).iterable))
+                break
+            else:
+                source = None
+        if source is None and not iterators:
+            return
+        yield from _round(iterators)
+
+
+def _interleave(iterables):
+    iterators = [iter(iterable) for iterable in iterables]
+    while iterators:
+        yield from _round(iterators)
+
+
+def _round(iterators):
+    """Yield the next value of each iterator, removing exhausted ones."""
+    live = []
+    for it in iterators:
+        for value in it:
+            live.append(it)
+            yield value
+            break
+    iterators[:] = live
@@ -0,0 +1,109 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tracing where Maybe computations fail.
+
+When a chain of fmap() and bind() calls ends in Nothing, tracing records
+which function gave Nothing.  Tracing is off by default.  While enabled,
+each time Just.fmap(), a monadic() function, lift(), map_n() or an fmap()
+stage of a MaybePipeline gives Nothing because a function raised an
+exception or returned None, a sample of the failures is recorded in a
+ring buffer:
+
+    trace.enable(rate=0.01)
+    run_pipeline()
+    for record in trace.records():
+        log.warning('%s failed on %s: %s', record.function, record.input,
+                    record.exception)
+
+Only failures are traced, so successful calls cost the same as when
+tracing is off.
+
+Functions:
+enable -- Start tracing failures
+disable -- Stop tracing failures
+records -- Return the recorded failures
+clear -- Clear the recorded failures
+
+Classes:
+Record -- Record of a failure
+"""
+
+import collections
+import random
+import reprlib
+
+import mir.monads.maybe as maybe
+
+# function is the qualified name of the function that failed, exception
+# the type of the exception it raised or None if it returned None, and
+# input the shortened repr() of its input.
+Record = collections.namedtuple('Record', 'function exception input')
+
+_records = collections.deque(maxlen=1000)
+
+
+def enable(rate=1.0, maxlen=1000, repr_limit=80):
+    """Start tracing failures.
+
+    rate is the fraction of failures to record, chosen at random.  maxlen
+    is the number of records to keep; older records are dropped.
+    repr_limit is the maximum length of input reprs.  Calling enable() again
+    changes the settings and keeps the records that fit.
+    """
+    global _records
+    if not 0 <= rate <= 1:
+        raise ValueError('rate must be from 0 to 1')
+    _records = collections.deque(_records, maxlen=maxlen)
+    maybe._trace = _Tracer(_records, rate, repr_limit)
+
+
+def disable():
+    """Stop tracing failures.  The records are kept."""
+    maybe._trace = None
+
+
+def records():
+    """Return a list of the recorded failures, oldest first."""
+    return list(_records)
+
+
+def clear():
+    """Clear the recorded failures."""
+    _records.clear()
+
+
+class _Tracer:
+
+    """Function recording a sample of failures."""
+
+    __slots__ = ('_append', '_rate', '_random', '_repr', '_repr_limit')
+
+    def __init__(self, records, rate, repr_limit):
+        self._append = records.append
+        self._rate = rate
+        self._random = random.random
+        shortener = reprlib.Repr()
+        shortener.maxstring = shortener.maxother = repr_limit
+        self._repr = shortener.repr
+        self._repr_limit = repr_limit
+
+    def __call__(self, f, value, exception):
+        if self._rate < 1 and self._random() >= self._rate:
+            return
+        name = getattr(f, '__qualname__', None) or type(f).__qualname__
+        self._append(Record(
+            name,
+            None if exception is None else type(exception),
+            self._repr(value)[:self._repr_limit]))
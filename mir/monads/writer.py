@@ -0,0 +1,201 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Writer monad.
+
+A Writer holds a value and a log of entries.  Binding a Writer appends
+the log of the result to the log of the Writer.
+
+    @writer.logged
+    def half(x):
+        return x // 2, 'halved %d' % x
+
+    writer.writer(8).bind(half).bind(half) == writer.writer(
+        2, 'halved 8', 'halved 4')
+
+Logs are ropes, so appending one log to another takes constant time no
+matter how long the logs are, and a long chain of binds takes linear
+time.
+
+Inside a streaming() block, entries are passed to a sink as soon as
+they are told instead of being kept in logs.
+
+Functions:
+writer -- Make a Writer with the given entries
+tell -- Make a Writer with the given entries and no value
+logged -- Decorate a function returning a value and entries
+streaming -- Context manager for streaming entries to a sink
+
+Classes:
+Log -- Log of entries
+Writer -- Writer monad
+"""
+
+import contextlib
+import functools
+import threading
+
+import mir.monads.abc as monads_abc
+import mir.monads.data as data
+
+
+class Log:
+
+    """Log of entries.
+
+    Logs are immutable.  Adding two logs takes constant time.  Iterating
+    over a log takes linear time, and the entries are kept flattened
+    afterward.
+    """
+
+    __slots__ = ('_left', '_right', '_len')
+
+    def __init__(self, entries=()):
+        self._left = tuple(entries)
+        self._right = None
+        self._len = len(self._left)
+
+    @classmethod
+    def _concat(cls, left, right):
+        log = object.__new__(cls)
+        log._left = left
+        log._right = right
+        log._len = left._len + right._len
+        return log
+
+    def __add__(self, other):
+        if other.__class__ is not Log:
+            return NotImplemented
+        if not other._len:
+            return self
+        if not self._len:
+            return other
+        return Log._concat(self, other)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        if self._right is not None:
+            self._flatten()
+        return iter(self._left)
+
+    def _flatten(self):
+        entries = []
+        extend = entries.extend
+        stack = [self]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node = pop()
+            if node._right is None:
+                extend(node._left)
+            else:
+                push(node._right)
+                push(node._left)
+        self._left = tuple(entries)
+        self._right = None
+
+    def __eq__(self, other):
+        if other.__class__ is not Log:
+            return NotImplemented
+        return self._len == other._len and tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return (Log, (tuple(self),))
+
+    def __repr__(self):
+        return 'Log(%r)' % (list(self),)
+
+
+_EMPTY = Log()
+
+
+class Writer(monads_abc.Monad, metaclass=data.Constructor):
+
+    """Writer monad."""
+
+    fields = ('value', 'log')
+    tag = 7
+
+    def fmap(self, f):
+        value, log = self
+        return Writer(f(value), log)
+
+    def apply(self, other):
+        f, log = self
+        value, other_log = other
+        return Writer(f(value), log + other_log)
+
+    def bind(self, f):
+        value, log = self
+        value, other_log = f(value)
+        return Writer(value, log + other_log)
+
+
+def writer(value, *entries):
+    """Make a Writer with the given entries."""
+    return Writer(value, _log(entries))
+
+
+def tell(*entries):
+    """Make a Writer with the given entries and no value."""
+    return Writer(None, _log(entries))
+
+
+def logged(f):
+    """Decorate a function returning a value and entries to return Writer.
+
+    The function returns a tuple of the value followed by any number of
+    entries.
+    """
+    @functools.wraps(f)
+    def wrapped(a):
+        value, *entries = f(a)
+        return Writer(value, _log(entries))
+    return wrapped
+
+
+_local = threading.local()
+
+
+@contextlib.contextmanager
+def streaming(sink):
+    """Context manager for streaming entries to a sink.
+
+    Inside the block, the functions in this module call sink with each
+    entry instead of adding it to a log, so the logs stay empty.
+    Entries are passed to sink in the order they are told, which is the
+    same as their order in the log for computations that make their
+    Writers in order.  The setting is per thread.
+    """
+    previous = getattr(_local, 'sink', None)
+    _local.sink = sink
+    try:
+        yield sink
+    finally:
+        _local.sink = previous
+
+
+def _log(entries):
+    """Return a Log of entries, or send them to the current sink."""
+    sink = getattr(_local, 'sink', None)
+    if sink is None:
+        return Log(entries) if entries else _EMPTY
+    for entry in entries:
+        sink(entry)
+    return _EMPTY
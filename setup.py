@@ -31,4 +31,7 @@ setup(
     ],
 
     packages=['mir.monads'],
+    extras_require={
+        'numpy': ['numpy'],
+    },
 )
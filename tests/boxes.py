@@ -0,0 +1,52 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Box monad used by several tests, built on mir.monads.fastabc."""
+
+from mir.monads import fastabc
+
+
+class Box(fastabc.Monad, abstract=True):
+    __slots__ = ()
+
+
+class Full(Box, metaclass=fastabc.Constructor):
+
+    arity = 1
+
+    def fmap(self, f):
+        value, = self
+        return Full(f(value))
+
+    def apply(self, other):
+        value, = self
+        return other.fmap(value)
+
+    def bind(self, f):
+        value, = self
+        return f(value)
+
+
+class Empty(Box, metaclass=fastabc.Constructor):
+
+    arity = 0
+
+    def fmap(self, f):
+        return self
+
+    def apply(self, other):
+        return self
+
+    def bind(self, f):
+        return self
@@ -0,0 +1,64 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for abstract base classes."""
+
+import pytest
+
+from mir.monads.id import Identity
+import mir.monads.maybe as maybe
+
+DEPTH = 100000
+
+
+@pytest.mark.parametrize('unit', [maybe.Just, Identity])
+def test_lazy_bind_right_nested(unit):
+    def count_down(n):
+        if n == 0:
+            return unit('done')
+        return unit(n - 1).lazy_bind(count_down)
+    assert count_down(DEPTH).run() == unit('done')
+
+
+@pytest.mark.parametrize('unit', [maybe.Just, Identity])
+def test_lazy_bind_left_nested(unit):
+    m = unit(0)
+    for _ in range(DEPTH):
+        m = m.lazy_bind(lambda x: unit(x + 1))
+    assert m.run() == unit(DEPTH)
+
+
+def test_lazy_bind_nothing():
+    m = maybe.Just(0).lazy_bind(lambda x: maybe.Nothing())
+    for _ in range(DEPTH):
+        m = m.lazy_bind(lambda x: maybe.Just(x + 1))
+    assert m.run() is maybe.Nothing()
+
+
+def test_lazy_bind_fmap():
+    m = Identity(1).lazy_bind(lambda x: Identity(x + 1)).fmap(str)
+    assert m.run() == Identity('2')
+
+
+def test_lazy_bind_apply():
+    m = maybe.Just(1).lazy_bind(lambda x: maybe.Just(lambda y: x + y))
+    assert m.apply(maybe.Just(2)).run() == maybe.Just(3)
+
+
+def test_lazy_bind_is_lazy():
+    calls = []
+    m = Identity(1).lazy_bind(calls.append)
+    assert calls == []
+    m.run()
+    assert calls == [1]
@@ -0,0 +1,139 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for AsyncMaybe."""
+
+import asyncio
+
+from mir.monads import asyncmaybe
+from mir.monads.asyncmaybe import AsyncMaybe
+import mir.monads.maybe as maybe
+
+
+def _run(coroutine):
+    # asyncio.run() needs Python 3.7.
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def run(m):
+    async def main():
+        return await m
+    return _run(main())
+
+
+@asyncmaybe.monadic
+async def invert(a):
+    await asyncio.sleep(0)
+    return 1 / a
+
+
+async def add_one(a):
+    return a + 1
+
+
+def test_monadic():
+    assert run(invert(2)) == maybe.Just(0.5)
+
+
+def test_monadic_exception():
+    assert run(invert(0)) is maybe.Nothing()
+
+
+def test_monadic_none():
+    @asyncmaybe.monadic
+    async def f(a):
+        return None
+    assert run(f(1)) is maybe.Nothing()
+
+
+def test_await_twice():
+    calls = []
+
+    @asyncmaybe.monadic
+    async def f(a):
+        calls.append(a)
+        return a
+
+    async def main():
+        m = f(1)
+        return await m, await m
+    assert _run(main()) == (maybe.Just(1), maybe.Just(1))
+    assert calls == [1]
+
+
+def test_fmap():
+    assert run(invert(1).fmap(lambda x: x + 1)) == maybe.Just(2)
+
+
+def test_fmap_coroutine():
+    assert run(invert(1).fmap(add_one)) == maybe.Just(2)
+
+
+def test_fmap_nothing():
+    assert run(invert(0).fmap(add_one)) is maybe.Nothing()
+
+
+def test_bind_maybe():
+    assert run(invert(2).bind(maybe.Just)) == maybe.Just(0.5)
+
+
+def test_bind_async_maybe():
+    assert run(invert(2).bind(invert)) == maybe.Just(2)
+
+
+def test_bind_nothing():
+    assert run(invert(0).bind(invert)) is maybe.Nothing()
+
+
+def test_apply():
+    m = AsyncMaybe.from_maybe(maybe.Just(add_one)).apply(invert(1))
+    assert run(m) == maybe.Just(2)
+
+
+def test_apply_plain_maybe():
+    m = AsyncMaybe.from_maybe(maybe.Just(add_one)).apply(maybe.Nothing())
+    assert run(m) is maybe.Nothing()
+
+
+def test_lift():
+    m = asyncmaybe.lift(lambda a, b: a + b, invert(1), maybe.Just(2))
+    assert run(m) == maybe.Just(3)
+
+
+def test_lift_nothing():
+    m = asyncmaybe.lift(lambda a, b: a + b, invert(0), invert(1))
+    assert run(m) is maybe.Nothing()
+
+
+def test_lift_concurrent():
+    async def main():
+        event = asyncio.Event()
+
+        @asyncmaybe.monadic
+        async def wait(a):
+            await event.wait()
+            return a
+
+        @asyncmaybe.monadic
+        async def notify(a):
+            event.set()
+            return a
+
+        m = asyncmaybe.lift(lambda a, b: a + b, wait(1), notify(2))
+        return await asyncio.wait_for(m, timeout=1)
+    assert _run(main()) == maybe.Just(3)
@@ -0,0 +1,105 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for compact batch encoding."""
+
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from mir.monads import codec
+import mir.monads.data as data
+from mir.monads.either import Failure
+from mir.monads.either import Left
+from mir.monads.either import Right
+from mir.monads.id import Identity
+import mir.monads.maybe as maybe
+
+
+class Triple(metaclass=data.Constructor):
+    fields = ('a', 'b', 'c')
+    tag = 201
+
+
+VALUES = [
+    maybe.Just(1),
+    maybe.Nothing(),
+    Identity('a'),
+    Left(Failure(ValueError, 'bad')),
+    Right([1, 2]),
+    Triple(1, maybe.Just(2), None),
+    (1, 2),
+    None,
+]
+
+
+def test_round_trip():
+    assert codec.loads(codec.dumps(VALUES)) == VALUES
+
+
+def test_round_trip_types():
+    for value, decoded in zip(VALUES, codec.loads(codec.dumps(VALUES))):
+        assert type(decoded) is type(value)
+
+
+def test_nothing_identity():
+    assert codec.loads(codec.dumps([maybe.Nothing()]))[0] is maybe.Nothing()
+
+
+def test_empty():
+    assert codec.loads(codec.dumps([])) == []
+
+
+def test_smaller_than_pickle():
+    values = [maybe.Just(i) for i in range(100)] + [maybe.Nothing()] * 100
+    assert len(codec.dumps(values)) < len(pickle.dumps(values)) / 2
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+def test_protocols(protocol):
+    assert codec.loads(codec.dumps(VALUES, protocol)) == VALUES
+
+
+NESTED = {'a': VALUES, 'b': (maybe.Just(maybe.Just(1)), [maybe.Nothing()])}
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickler_round_trip(protocol):
+    decoded = codec.pickle_loads(codec.pickle_dumps(NESTED, protocol))
+    assert decoded == NESTED
+    assert type(decoded['b'][0].value) is maybe.Just
+
+
+def test_pickler_nothing_identity():
+    decoded = codec.pickle_loads(codec.pickle_dumps([maybe.Nothing()]))
+    assert decoded[0] is maybe.Nothing()
+
+
+@pytest.mark.parametrize('value', [maybe.Just(1), maybe.Nothing()])
+def test_pickler_smaller_than_pickle(value):
+    assert len(codec.pickle_dumps(value)) < len(pickle.dumps(value)) / 2
+
+
+def test_default_pickle_loads_in_new_process():
+    encoded = pickle.dumps([maybe.Just(1), maybe.Nothing()])
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, '-c',
+         'import pickle, sys; '
+         'print(pickle.loads(sys.stdin.buffer.read()))'],
+        input=encoded, stdout=subprocess.PIPE, cwd=root, check=True)
+    assert result.stdout.strip() == b'[(1,), ()]'
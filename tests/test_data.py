@@ -14,6 +14,11 @@
 
 """Test data constructors."""
 
+import copy
+import functools
+import importlib
+import pickle
+
 import pytest
 
 import mir.monads.data as data
@@ -44,3 +49,287 @@ def test_no_slots():
     x = UnaryConstructor(1)
     with pytest.raises(AttributeError):
         x.foo = 1
+
+
+class BinaryConstructor(metaclass=data.Constructor):
+    fields = ('left', 'right')
+
+
+def test_fields():
+    x = BinaryConstructor(1, 2)
+    assert (x.left, x.right) == (1, 2)
+
+
+def test_fields_unpack():
+    left, right = BinaryConstructor(1, 2)
+    assert (left, right) == (1, 2)
+
+
+def test_fields_arity_mismatch():
+    with pytest.raises(TypeError):
+        class Bad(metaclass=data.Constructor):
+            arity = 1
+            fields = ('left', 'right')
+
+
+def test_fields_invalid_name():
+    with pytest.raises(ValueError):
+        class Bad(metaclass=data.Constructor):
+            fields = ('class',)
+
+
+def test_fields_string():
+    class StringFields(metaclass=data.Constructor):
+        fields = ('value')
+    assert StringFields.arity == 1
+    assert StringFields(1).value == 1
+
+
+def test_fields_string_several():
+    class StringFields(metaclass=data.Constructor):
+        fields = 'left, right'
+    assert StringFields(1, 2).right == 2
+
+
+def test_fields_conflict():
+    with pytest.raises(ValueError):
+        class Bad(metaclass=data.Constructor):
+            fields = ('value',)
+
+            def value(self):
+                pass
+
+
+def test_not_eq_other_constructor():
+    assert BinaryConstructor(1, 2) != UnaryConstructor((1, 2))
+
+
+def test_too_many_arguments():
+    with pytest.raises(TypeError):
+        BinaryConstructor(1, 2, 3)
+
+
+def test_hash():
+    assert hash(UnaryConstructor(1)) == hash(UnaryConstructor(1))
+
+
+def test_hash_includes_constructor():
+    assert hash(UnaryConstructor(1)) != hash((1,))
+
+
+def test_hash_set():
+    assert len({UnaryConstructor(1), UnaryConstructor(1), (1,)}) == 2
+
+
+def test_hash_lru_cache():
+    @functools.lru_cache()
+    def f(x):
+        return object()
+    assert f(UnaryConstructor(1)) is f(UnaryConstructor(1))
+
+
+class MutableConstructor(metaclass=data.Constructor):
+    arity = 1
+    hashable = False
+
+
+def test_hash_opt_out():
+    with pytest.raises(TypeError):
+        hash(MutableConstructor([]))
+
+
+class CachedHashConstructor(metaclass=data.Constructor):
+    arity = 1
+    cache_hash = True
+
+
+def test_cached_hash():
+    x = CachedHashConstructor(tuple(range(100)))
+    assert hash(x) == hash(x) == hash(CachedHashConstructor(tuple(range(100))))
+
+
+def test_cached_hash_unhashable():
+    with pytest.raises(TypeError):
+        hash(CachedHashConstructor([]))
+
+
+class NullaryConstructor(metaclass=data.Constructor):
+    arity = 0
+
+
+def test_nullary_singleton():
+    assert NullaryConstructor() is NullaryConstructor()
+
+
+def test_pickle():
+    x = UnaryConstructor(1)
+    assert pickle.loads(pickle.dumps(x)) == x
+
+
+def test_pickle_nullary_identity():
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        x = pickle.loads(pickle.dumps(NullaryConstructor(), protocol))
+        assert x is NullaryConstructor()
+
+
+def test_copy():
+    x = UnaryConstructor([1])
+    assert copy.deepcopy(x) == x
+    assert copy.copy(NullaryConstructor()) is NullaryConstructor()
+
+
+def test_hash_nullary():
+    assert hash(NullaryConstructor()) == hash(NullaryConstructor())
+
+
+class TaggedConstructor(metaclass=data.Constructor):
+    arity = 1
+    tag = 200
+
+
+def test_tagged_classes():
+    assert data.tagged_classes()[200] is TaggedConstructor
+
+
+def test_tag_pickle():
+    x = TaggedConstructor(1)
+    assert pickle.loads(pickle.dumps(x)) == x
+
+
+def test_tag_pickle_by_name():
+    assert b'TaggedConstructor' in pickle.dumps(TaggedConstructor(1))
+
+
+def test_duplicate_tag():
+    with pytest.raises(ValueError):
+        class Bad(metaclass=data.Constructor):
+            arity = 1
+            tag = 200
+
+
+_TAGGED_MODULE = '''
+import mir.monads.data as data
+
+
+class Point(metaclass=data.Constructor):
+    arity = 2
+    tag = %d
+'''
+
+
+def test_duplicate_tag_same_name_other_module(tmp_path, monkeypatch):
+    (tmp_path / 'tag_a.py').write_text(_TAGGED_MODULE % 202)
+    (tmp_path / 'tag_b.py').write_text(_TAGGED_MODULE % 202)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.import_module('tag_a')
+    with pytest.raises(ValueError):
+        importlib.import_module('tag_b')
+
+
+def test_tag_module_reload(tmp_path, monkeypatch):
+    (tmp_path / 'tag_reload.py').write_text(_TAGGED_MODULE % 203)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module('tag_reload')
+    old = module.Point
+    module = importlib.reload(module)
+    assert module.Point is not old
+    assert data.tagged_classes()[203] is module.Point
+
+
+def test_invalid_tag():
+    with pytest.raises(ValueError):
+        class Bad(metaclass=data.Constructor):
+            arity = 1
+            tag = 256
+
+
+def test_arity():
+    assert BinaryConstructor.arity == 2
+
+
+class InternedConstructor(metaclass=data.Constructor):
+    fields = ('value',)
+    intern = 2
+
+
+@pytest.fixture
+def interned():
+    data.intern_clear(InternedConstructor)
+    return InternedConstructor
+
+
+def test_intern(interned):
+    assert interned(1) is interned(1)
+
+
+def test_intern_types(interned):
+    assert interned(1) is not interned(True)
+    assert interned(True).value is True
+
+
+def test_intern_unhashable(interned):
+    assert interned([1]) == interned([1])
+    assert interned([1]) is not interned([1])
+
+
+def test_intern_float(interned):
+    assert interned(0.0) is not interned(0.0)
+    assert str(interned(-0.0).value) == '-0.0'
+
+
+def test_intern_tuple(interned):
+    assert interned((1,)) is not interned((1,))
+    assert interned((True,)).value[0] is True
+
+
+def test_intern_other_types_not_counted(interned):
+    interned(1.5)
+    assert data.intern_info(interned).misses == 0
+
+
+def test_intern_eviction(interned):
+    a = interned(1)
+    interned(2)
+    interned(1)
+    interned(3)
+    assert interned(1) is a
+    assert data.intern_info(interned).evictions == 1
+    assert data.intern_info(interned).currsize == 2
+
+
+def test_intern_info(interned):
+    interned(1)
+    interned(1)
+    interned(2)
+    assert data.intern_info(interned) == data.InternInfo(
+        hits=1, misses=2, evictions=0, maxsize=2, currsize=2)
+
+
+def test_intern_pickle(interned):
+    x = interned(1)
+    assert pickle.loads(pickle.dumps(x)) is x
+
+
+def test_intern_default_size():
+    class Interned(metaclass=data.Constructor):
+        arity = 2
+        intern = True
+    assert Interned(1, 2) is Interned(1, 2)
+    assert data.intern_info(Interned).maxsize == data.DEFAULT_INTERN_SIZE
+
+
+def test_set_interning():
+    class Interned(metaclass=data.Constructor):
+        arity = 1
+    assert Interned(1) is not Interned(1)
+    data.set_interning(Interned, 10)
+    assert Interned(1) is Interned(1)
+    data.set_interning(Interned, None)
+    assert Interned(1) is not Interned(1)
+    with pytest.raises(TypeError):
+        data.intern_info(Interned)
+
+
+def test_intern_info_not_interned():
+    with pytest.raises(TypeError):
+        data.intern_info(UnaryConstructor)
@@ -0,0 +1,163 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for do-notation."""
+
+import pytest
+
+from mir.monads.do import do
+import mir.monads.fetch as fetch
+import mir.monads.free as free
+from mir.monads.either import Left
+from mir.monads.either import Right
+from mir.monads.id import Identity
+import mir.monads.maybe as maybe
+from mir.monads.stream import Stream
+import mir.monads.writer as writer
+
+from tests.boxes import Empty
+from tests.boxes import Full
+
+
+@maybe.monadic
+def invert(a):
+    return 1 / a
+
+
+@do
+def add_inverses(a, b):
+    x = yield invert(a)
+    y = yield invert(b)
+    return maybe.Just(x + y)
+
+
+def test_maybe():
+    assert add_inverses(1, 2) == maybe.Just(1.5)
+
+
+def test_maybe_nothing():
+    assert add_inverses(0, 2) is maybe.Nothing()
+
+
+def test_nested_binds():
+    def nested(a, b):
+        return invert(a).bind(
+            lambda x: invert(b).bind(
+                lambda y: maybe.Just(x + y)))
+    for a, b in [(1, 2), (0, 1), (1, 0)]:
+        assert add_inverses(a, b) == nested(a, b)
+
+
+def test_short_circuit_closes_generator():
+    steps = []
+
+    @do
+    def f():
+        try:
+            yield maybe.Nothing()
+            steps.append('after')
+        finally:
+            steps.append('closed')
+    assert f() is maybe.Nothing()
+    assert steps == ['closed']
+
+
+def test_identity():
+    @do
+    def f(a):
+        x = yield Identity(a)
+        return Identity(x + 1)
+    assert f(1) == Identity(2)
+
+
+def test_either():
+    @do
+    def f(a):
+        x = yield Right(a)
+        yield Left('stop')
+        return Right(x)
+    assert f(1) == Left('stop')
+
+
+def test_long():
+    @do
+    def f(n):
+        total = 0
+        for i in range(n):
+            total += yield maybe.Just(i)
+        return maybe.Just(total)
+    assert f(100000) == maybe.Just(sum(range(100000)))
+
+
+def test_user_defined_monad():
+    @do
+    def f(m):
+        x = yield Full(1)
+        y = yield m
+        return Full(x + y)
+    assert f(Full(2)) == Full(3)
+    assert f(Empty()) is Empty()
+
+
+def test_writer():
+    @do
+    def f(a):
+        x = yield writer.writer(a, 'got a')
+        yield writer.tell('told')
+        y = yield writer.writer(x + 1, 'added one')
+        return writer.writer(y * 2, 'doubled')
+    assert f(1) == writer.writer(4, 'got a', 'told', 'added one', 'doubled')
+
+
+def test_free():
+    @do
+    def f():
+        x = yield free.send('a')
+        y = yield free.send('b')
+        return free.Pure(x + y)
+    effects = []
+
+    def handler(effect):
+        effects.append(effect)
+        return effect.upper()
+    assert free.run(f(), handler) == 'AB'
+    assert effects == ['a', 'b']
+
+
+def test_fetch():
+    @do
+    def f():
+        x = yield fetch.done(1)
+        y = yield fetch.done(2)
+        return fetch.done(x + y)
+    assert fetch.run(f()) == 3
+
+
+def test_mixed_known_and_generic():
+    @do
+    def f():
+        x = yield Full(1)
+        y = yield maybe.Just(2)
+        z = yield Full(3)
+        return Full(x + y + z)
+    assert f() == Full(6)
+
+
+def test_stream_raises():
+    @do
+    def f():
+        x = yield Stream([1, 2])
+        return Stream([x])
+    with pytest.raises(TypeError):
+        list(f().iterable)
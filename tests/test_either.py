@@ -0,0 +1,88 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for Either Monad."""
+
+import mir.monads.either as either
+from mir.monads.either import Failure
+from mir.monads.either import Left
+from mir.monads.either import Right
+
+
+@either.monadic
+def invert(a):
+    if a == 0:
+        return Left('zero')
+    return 1 / a
+
+
+@either.catching
+def parse(s):
+    return int(s)
+
+
+def test_fmap_right():
+    assert Right(1).fmap(lambda x: x + 1) == Right(2)
+
+
+def test_fmap_left():
+    assert Left('a').fmap(lambda x: x + 1) == Left('a')
+
+
+def test_apply_right():
+    assert Right(lambda x: x + 1).apply(Right(1)) == Right(2)
+
+
+def test_apply_left():
+    assert Left('a').apply(Right(1)) == Left('a')
+
+
+def test_bind():
+    assert Right(2).bind(invert) == Right(0.5)
+
+
+def test_bind_left():
+    assert Right(0).bind(invert).bind(invert) == Left('zero')
+
+
+def test_left_not_eq_right():
+    assert Left(1) != Right(1)
+
+
+def test_monadic_right():
+    assert either.monadic(lambda a: Right(a))(1) == Right(1)
+
+
+def test_monadic_none():
+    assert either.monadic(lambda a: None)(1) == Right(None)
+
+
+def test_catching():
+    assert parse('1') == Right(1)
+
+
+def test_catching_exception():
+    result = parse('a')
+    assert isinstance(result, Left)
+    failure, = result
+    assert failure.type is ValueError
+    assert 'a' in failure.message
+
+
+def test_catching_left():
+    assert either.catching(lambda a: Left(a))(1) == Left(1)
+
+
+def test_failure_hashable():
+    assert hash(Failure(ValueError, 'a')) == hash(Failure(ValueError, 'a'))
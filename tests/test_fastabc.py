@@ -0,0 +1,110 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for lightweight abstract base classes."""
+
+import pytest
+
+import mir.monads.abc as monads_abc
+import mir.monads.data as data
+from mir.monads import fastabc
+import mir.monads.maybe as maybe
+
+from tests.boxes import Box
+from tests.boxes import Full
+
+
+def test_constructor():
+    assert Full(1).fmap(lambda x: x + 1) == Full(2)
+
+
+def test_isinstance():
+    assert isinstance(Full(1), Box)
+    assert isinstance(Full(1), fastabc.Monad)
+
+
+def test_isinstance_abc():
+    assert isinstance(Full(1), monads_abc.Monad)
+    assert isinstance(Full(1), monads_abc.Functor)
+
+
+def test_no_dict():
+    with pytest.raises(AttributeError):
+        Full(1).foo = 1
+
+
+def test_missing_method():
+    with pytest.raises(TypeError):
+        class Bad(Box, metaclass=fastabc.Constructor):
+            arity = 1
+
+            def fmap(self, f):
+                pass
+
+
+def test_missing_method_plain_class():
+    with pytest.raises(TypeError):
+        class Bad(fastabc.Functor):
+            pass
+
+
+def test_abstract_subclass():
+    class Partial(fastabc.Monad, abstract=True):
+        def fmap(self, f):
+            pass
+    assert Partial._abstract_methods == {'apply', 'bind'}
+
+
+def test_lazy_bind():
+    m = Full(1).lazy_bind(lambda x: Full(x + 1))
+    assert m.run() == Full(2)
+
+
+def test_abstract_constructor():
+    class Partial(Box, metaclass=fastabc.Constructor, abstract=True):
+        arity = 1
+
+        def fmap(self, f):
+            return self
+    assert Partial(1).fmap(str) == Partial(1)
+
+
+def test_builtin_monads_extensible():
+    class Maybe2(maybe.Maybe, metaclass=data.Constructor):
+        arity = 1
+
+        def fmap(self, f):
+            return self
+
+        def apply(self, other):
+            return self
+
+        def bind(self, f):
+            return self
+
+    class Sub(maybe.Maybe):
+        pass
+
+    class Registered:
+        pass
+
+    maybe.Maybe.register(Registered)
+    assert isinstance(Maybe2(1), maybe.Maybe)
+    assert issubclass(Sub, maybe.Maybe)
+    assert isinstance(Registered(), maybe.Maybe)
+
+
+def test_fastabc_values_with_builtin_monads():
+    assert maybe.Just(1).bind(lambda x: Full(x)) == Full(1)
+    assert isinstance(Full(1), monads_abc.Monad)
@@ -0,0 +1,176 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for Fetch monad."""
+
+import sqlite3
+
+import pytest
+
+import mir.monads.fetch as fetch
+
+
+class DictSource(fetch.DataSource):
+
+    def __init__(self, values):
+        self.values = values
+        self.calls = []
+
+    def fetch(self, keys):
+        self.calls.append(keys)
+        return {key: self.values[key] for key in keys}
+
+
+class SQLiteSource(fetch.DataSource):
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def fetch(self, keys):
+        query = 'SELECT key, value FROM kv WHERE key IN (%s)' % (
+            ', '.join('?' * len(keys)),)
+        return dict(self.connection.execute(query, keys))
+
+
+@pytest.fixture
+def source():
+    return DictSource({'a': 1, 'b': 2, 'c': 3, 1: 'b', 2: 'c'})
+
+
+def test_done():
+    assert fetch.run(fetch.done(1)) == 1
+
+
+def test_request(source):
+    assert fetch.run(fetch.request(source, 'a')) == 1
+
+
+def test_fmap(source):
+    m = fetch.request(source, 'a').fmap(lambda x: x + 1)
+    assert fetch.run(m) == 2
+
+
+def test_apply_batches(source):
+    env = fetch.Env()
+    m = fetch.request(source, 'a').fmap(lambda a: lambda b: a + b).apply(
+        fetch.request(source, 'b'))
+    assert fetch.run(m, env) == 3
+    assert source.calls == [['a', 'b']]
+    assert (env.rounds, env.batches, env.requests) == (1, 1, 2)
+
+
+def test_apply_done(source):
+    m = fetch.done(lambda x: x + 1).apply(fetch.request(source, 'a'))
+    assert fetch.run(m) == 2
+    m = fetch.request(source, 'a').fmap(lambda a: lambda b: a + b).apply(
+        fetch.done(1))
+    assert fetch.run(m) == 2
+
+
+def test_bind_rounds(source):
+    env = fetch.Env()
+    m = fetch.request(source, 1).bind(lambda k: fetch.request(source, k))
+    assert fetch.run(m, env) == 2
+    assert source.calls == [[1], ['b']]
+    assert env.rounds == 2
+
+
+def test_long_bind_chain():
+    source = DictSource({i: i + 1 for i in range(2000)})
+    env = fetch.Env()
+    m = fetch.request(source, 0)
+    for _ in range(1999):
+        m = m.bind(lambda k: fetch.request(source, k))
+    assert fetch.run(m, env) == 2000
+    assert env.rounds == 2000
+
+
+def test_long_done_chain():
+    m = fetch.done(0)
+    for _ in range(10000):
+        m = m.bind(lambda v: fetch.done(v + 1)).fmap(lambda v: v)
+    assert fetch.run(m) == 10000
+
+
+def test_nested_binds(source):
+    def count(n):
+        if n == 0:
+            return fetch.request(source, 'a')
+        return fetch.done(n).bind(lambda n: count(n - 1))
+    assert fetch.run(count(10000)) == 1
+
+
+def test_traverse(source):
+    env = fetch.Env()
+    m = fetch.traverse(
+        lambda k: fetch.request(source, k).bind(
+            lambda v: fetch.request(source, v)),
+        [1, 2])
+    assert fetch.run(m, env) == [2, 3]
+    assert source.calls == [[1, 2], ['b', 'c']]
+    assert (env.rounds, env.batches, env.requests) == (2, 2, 4)
+
+
+def test_sequence_done():
+    assert fetch.run(fetch.sequence([fetch.done(1), fetch.done(2)])) == [1, 2]
+
+
+def test_deduplicates(source):
+    env = fetch.Env()
+    m = fetch.traverse(lambda k: fetch.request(source, k), ['a', 'b', 'a'])
+    assert fetch.run(m, env) == [1, 2, 1]
+    assert source.calls == [['a', 'b']]
+    assert env.requests == 2
+
+
+def test_cache_across_rounds(source):
+    env = fetch.Env()
+    m = fetch.request(source, 'a').bind(
+        lambda a: fetch.request(source, 'a').fmap(lambda b: a + b))
+    assert fetch.run(m, env) == 2
+    assert source.calls == [['a']]
+    assert env.rounds == 1
+
+
+def test_cache_per_run(source):
+    m = fetch.request(source, 'a')
+    fetch.run(m)
+    fetch.run(m)
+    assert source.calls == [['a'], ['a']]
+
+
+def test_several_sources(source):
+    other = DictSource({'a': 10})
+    env = fetch.Env()
+    m = fetch.sequence([fetch.request(source, 'a'),
+                        fetch.request(other, 'a')])
+    assert fetch.run(m, env) == [1, 10]
+    assert (env.rounds, env.batches) == (1, 2)
+
+
+def test_sqlite():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE kv (key TEXT, value INTEGER)')
+    connection.executemany('INSERT INTO kv VALUES (?, ?)',
+                           [('a', 1), ('b', 2)])
+    source = SQLiteSource(connection)
+    env = fetch.Env()
+    m = fetch.traverse(lambda k: fetch.request(source, k), ['a', 'b'])
+    assert fetch.run(m, env) == [1, 2]
+    assert env.batches == 1
+
+
+def test_missing_key(source):
+    with pytest.raises(KeyError):
+        fetch.run(fetch.request(source, 'missing'))
@@ -0,0 +1,144 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for Free monad."""
+
+import pytest
+
+import mir.monads.data as data
+import mir.monads.free as free
+from mir.monads.free import Pure
+
+
+class Get(metaclass=data.Constructor):
+    fields = ('key',)
+
+
+class Put(metaclass=data.Constructor):
+    fields = ('key', 'value')
+
+
+class Incr(metaclass=data.Constructor):
+    arity = 0
+
+
+class Store:
+
+    def __init__(self, **values):
+        self.values = values
+        self.interpreter = free.Interpreter({Get: self.get, Put: self.put})
+
+    def get(self, effect):
+        return self.values[effect.key]
+
+    def put(self, effect):
+        self.values[effect.key] = effect.value
+
+
+def copy(src, dst):
+    return free.send(Get(src)).bind(lambda v: free.send(Put(dst, v)))
+
+
+def test_pure_fmap():
+    assert Pure(1).fmap(lambda x: x + 1) == Pure(2)
+
+
+def test_pure_bind():
+    assert Pure(1).bind(lambda x: Pure(x + 1)) == Pure(2)
+
+
+def test_pure_apply():
+    assert Pure(lambda x: x + 1).apply(Pure(1)) == Pure(2)
+
+
+def test_run():
+    store = Store(a=1)
+    store.interpreter.run(copy('a', 'b'))
+    assert store.values == {'a': 1, 'b': 1}
+
+
+def test_fmap():
+    store = Store(a=1)
+    program = free.send(Get('a')).fmap(lambda x: x + 1)
+    assert store.interpreter.run(program) == 2
+
+
+def test_apply():
+    store = Store(a=1, b=2)
+    program = free.send(Get('a')).fmap(lambda a: lambda b: a + b).apply(
+        free.send(Get('b')))
+    assert store.interpreter.run(program) == 3
+
+
+def test_same_program_different_interpreters():
+    effects = []
+    program = copy('a', 'b')
+    free.run(program, lambda e: effects.append(e) or 1)
+    store = Store(a=2)
+    store.interpreter.run(program)
+    assert effects == [Get('a'), Put('b', 1)]
+    assert store.values['b'] == 2
+
+
+def test_left_nested_binds():
+    program = Pure(0)
+    for _ in range(100000):
+        program = program.bind(
+            lambda x: free.send(Incr()).fmap(lambda y: x + y))
+    assert free.run(program, lambda e: 1) == 100000
+
+
+def test_left_nested_binds_on_effect():
+    program = free.send(Incr())
+    for _ in range(100000):
+        program = program.bind(lambda x: Pure(x + 1))
+    assert free.run(program, lambda e: 0) == 100000
+
+
+def test_right_nested_binds():
+    def loop(n, total):
+        if n == 0:
+            return Pure(total)
+        return free.send(Incr()).bind(lambda x: loop(n - 1, total + x))
+    assert free.run(loop(100000, 0), lambda e: 1) == 100000
+
+
+class Effect:
+    pass
+
+
+class Log(Effect, metaclass=data.Constructor):
+    fields = ('message',)
+
+
+def test_superclass_handler():
+    messages = []
+    interpreter = free.Interpreter({Effect: messages.append})
+    interpreter.run(free.send(Log('a')))
+    interpreter.run(free.send(Log('b')))
+    assert messages == [Log('a'), Log('b')]
+
+
+def test_missing_handler():
+    with pytest.raises(TypeError):
+        free.Interpreter({}).run(free.send(Incr()))
+
+
+def test_compile():
+    store = Store(a=1)
+    workflow = store.interpreter.compile(
+        lambda key: free.send(Get(key)),
+        lambda value: free.send(Put('b', value * 2)).fmap(lambda _: value))
+    assert workflow('a') == 1
+    assert store.values['b'] == 2
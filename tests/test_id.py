@@ -14,6 +14,9 @@
 
 """Tests for Identity Monad."""
 
+import concurrent.futures
+
+import mir.monads.id as id_
 from mir.monads.id import Identity
 
 
@@ -27,3 +30,42 @@ def test_apply():
 
 def test_bind():
     assert Identity(1).bind(lambda x: Identity(x + 1)) == Identity(2)
+
+
+def test_value():
+    assert Identity(1).value == 1
+
+
+def add_one(a):
+    return Identity(a + 1)
+
+
+def test_lift():
+    assert id_.lift(lambda a, b: a + b, Identity(1), Identity(2)) == \
+        Identity(3)
+
+
+def test_map_n():
+    got = id_.map_n(lambda a, b: a + b,
+                    [Identity(1), Identity(2)], [Identity(3), Identity(4)])
+    assert list(got) == [Identity(4), Identity(6)]
+
+
+def test_traverse():
+    assert id_.traverse(add_one, [1, 2]) == Identity([2, 3])
+
+
+def test_traverse_thread_pool():
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        result = id_.traverse(add_one, range(100), executor)
+    assert result == Identity(list(range(1, 101)))
+
+
+def test_traverse_process_pool():
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        result = id_.traverse(add_one, range(100), executor, chunksize=10)
+    assert result == Identity(list(range(1, 101)))
+
+
+def test_sequence():
+    assert id_.sequence([Identity(1), Identity(2)]) == Identity([1, 2])
@@ -0,0 +1,113 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for instrumentation."""
+
+import json
+
+import pytest
+
+import mir.monads.data as data
+from mir.monads import instrument
+from mir.monads.id import Identity
+import mir.monads.maybe as maybe
+
+
+@pytest.fixture
+def instrumented():
+    instrument.enable()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def stats(cls):
+    name = '%s.%s' % (cls.__module__, cls.__qualname__)
+    return instrument.snapshot()['classes'][name]
+
+
+def test_calls(instrumented):
+    maybe.Just(1).fmap(str).bind(maybe.Just)
+    assert stats(maybe.Just)['calls'] == {'fmap': 1, 'apply': 0, 'bind': 1}
+
+
+def test_short_circuits(instrumented):
+    maybe.Just(1).fmap(lambda x: None).fmap(str)
+    assert stats(maybe.Just)['short_circuits'] == 1
+    assert stats(maybe.Nothing)['calls']['fmap'] == 1
+    assert stats(maybe.Nothing)['short_circuits'] == 0
+
+
+def test_constructions(instrumented):
+    Identity(1).fmap(str)
+    assert stats(Identity)['constructions'] == 2
+
+
+def test_time(instrumented):
+    Identity(1).fmap(str)
+    time = stats(Identity)['time']['fmap']
+    assert time['count'] == 1
+    assert time['total_ns'] >= 0
+    assert sum(time['histogram']) == 1
+
+
+def test_snapshot_json(instrumented):
+    maybe.Just(1).fmap(str)
+    json.dumps(instrument.snapshot())
+
+
+def test_reset(instrumented):
+    maybe.Just(1).fmap(str)
+    instrument.reset()
+    assert stats(maybe.Just)['calls']['fmap'] == 0
+
+
+def test_reset_while_enabled(instrumented):
+    maybe.Just(1).fmap(str)
+    instrument.reset()
+    maybe.Just(1).fmap(str)
+    maybe.Just(1).fmap(str)
+    just = stats(maybe.Just)
+    assert just['calls']['fmap'] == 2
+    assert just['time']['fmap']['count'] == 2
+    assert sum(just['time']['fmap']['histogram']) == 2
+    assert just['constructions'] == 4
+
+
+def test_disable():
+    fmap = maybe.Just.fmap
+    new = maybe.Just.__dict__['__new__']
+    instrument.enable()
+    instrument.disable()
+    assert maybe.Just.fmap is fmap
+    assert maybe.Just.__dict__['__new__'] is new
+    maybe.Just(1).fmap(str)
+    assert stats(maybe.Just)['calls']['fmap'] == 0
+    instrument.reset()
+    assert instrument.snapshot()['classes'] == {}
+
+
+class Pair(metaclass=data.Constructor):
+    fields = ('a', 'b')
+
+
+def test_custom_constructor():
+    instrument.enable([Pair])
+    try:
+        Pair(1, 2)
+        assert Pair(1, 2) == Pair(1, 2)
+        assert stats(Pair)['constructions'] == 3
+    finally:
+        instrument.disable()
+        instrument.reset()
@@ -14,6 +14,12 @@
 
 """Tests for Maybe Monad."""
 
+import concurrent.futures
+import itertools
+import pickle
+
+import pytest
+
 import mir.monads.maybe as maybe
 
 
@@ -52,3 +58,360 @@ def test_apply_just():
 
 def test_apply_nothing():
     assert maybe.Nothing().apply(maybe.Just(1)) == maybe.Nothing()
+
+
+def test_nothing_singleton():
+    assert maybe.Nothing() is maybe.Nothing()
+
+
+def test_fmap_just_none_singleton():
+    assert maybe.Just(1).fmap(lambda x: None) is maybe.Nothing()
+
+
+def test_monadic_nothing_singleton():
+    assert invert(0) is maybe.Nothing()
+
+
+def test_pickle_nothing():
+    assert pickle.loads(pickle.dumps(maybe.Nothing())) is maybe.Nothing()
+
+
+def test_pickle_just():
+    assert pickle.loads(pickle.dumps(maybe.Just(1))) == maybe.Just(1)
+
+
+def test_map_maybe():
+    assert list(maybe.map_maybe(lambda a: 1 / a, [1, 0, 2])) == [1.0, 0.5]
+
+
+def test_map_maybe_none():
+    assert list(maybe.map_maybe(lambda a: a or None, [1, 0, 2])) == [1, 2]
+
+
+def test_map_maybe_lazy():
+    results = maybe.map_maybe(lambda a: 1 / a, itertools.count(1))
+    assert next(results) == 1
+
+
+def test_map_maybe_chunks():
+    chunks = maybe.map_maybe_chunks(lambda a: 1 / a, [1, 0, 0, 0, 2, 4], 2)
+    assert list(chunks) == [[1.0], [], [0.5, 0.25]]
+
+
+def test_cat_maybes():
+    maybes = [maybe.Just(1), maybe.Nothing(), maybe.Just(2)]
+    assert list(maybe.cat_maybes(maybes)) == [1, 2]
+
+
+def test_cat_maybes_map():
+    values = [1, 0, 2]
+    assert (list(maybe.cat_maybes(map(invert, values)))
+            == list(maybe.map_maybe(lambda a: 1 / a, values)))
+
+
+def test_partition_maybes():
+    successes, failures = maybe.partition_maybes(lambda a: 1 / a, [1, 0, 2])
+    assert list(successes) == [1.0, 0.5]
+    assert list(failures) == [0]
+
+
+def test_partition_maybes_calls_once():
+    calls = []
+
+    def f(a):
+        calls.append(a)
+        return a or None
+    successes, failures = maybe.partition_maybes(f, [1, 0, 2])
+    list(successes)
+    list(failures)
+    assert calls == [1, 0, 2]
+
+
+def test_traverse():
+    assert maybe.traverse(invert, [1, 2]) == maybe.Just([1.0, 0.5])
+
+
+def test_traverse_nothing():
+    calls = []
+
+    def f(a):
+        calls.append(a)
+        return invert(a)
+    assert maybe.traverse(f, itertools.count(0)) is maybe.Nothing()
+    assert calls == [0]
+
+
+def test_traverse_thread_pool():
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        result = maybe.traverse(invert, range(1, 101), executor, chunksize=7)
+    assert result == maybe.Just([1 / a for a in range(1, 101)])
+
+
+def test_traverse_thread_pool_nothing():
+    calls = []
+
+    def f(a):
+        calls.append(a)
+        return invert(a)
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        result = maybe.traverse(f, range(1000), executor, chunksize=10)
+    assert result is maybe.Nothing()
+    assert len(calls) < 1000
+
+
+def test_traverse_thread_pool_infinite():
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        result = maybe.traverse(invert, itertools.count(-500), executor,
+                                chunksize=10)
+    assert result is maybe.Nothing()
+
+
+def test_traverse_thread_pool_reads_lazily():
+    read = []
+
+    def items():
+        for a in range(100000):
+            read.append(a)
+            yield a
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        result = maybe.traverse(invert, items(), executor, chunksize=10)
+    assert result is maybe.Nothing()
+    assert len(read) < 1000
+
+
+def test_traverse_thread_pool_default_chunksize():
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        result = maybe.traverse(invert, range(1, 2001), executor)
+    assert result == maybe.Just([1 / a for a in range(1, 2001)])
+
+
+def test_traverse_process_pool():
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        result = maybe.traverse(invert, [1, 2, 0], executor)
+        assert result is maybe.Nothing()
+        result = maybe.traverse(invert, [1, 2, 4], executor)
+        assert result == maybe.Just([1.0, 0.5, 0.25])
+
+
+def test_sequence():
+    maybes = [maybe.Just(1), maybe.Just(2)]
+    assert maybe.sequence(maybes) == maybe.Just([1, 2])
+
+
+def test_sequence_nothing():
+    maybes = iter([maybe.Just(1), maybe.Nothing(), maybe.Just(2)])
+    assert maybe.sequence(maybes) is maybe.Nothing()
+    assert list(maybes) == [maybe.Just(2)]
+
+
+class FakeTimer:
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def counting_invert(calls, **kwargs):
+    @maybe.cached_monadic(**kwargs)
+    def f(a):
+        calls.append(a)
+        return 1 / a
+    return f
+
+
+def test_cached_monadic():
+    calls = []
+    f = counting_invert(calls)
+    assert f(2) == maybe.Just(0.5)
+    assert f(2) == maybe.Just(0.5)
+    assert calls == [2]
+    assert f.cache_info() == maybe.CacheInfo(1, 1, 0, 128, 1)
+
+
+def test_cached_monadic_nothing():
+    calls = []
+    f = counting_invert(calls)
+    assert f(0) is maybe.Nothing()
+    assert f(0) is maybe.Nothing()
+    assert calls == [0]
+
+
+def test_cached_monadic_lru():
+    calls = []
+    f = counting_invert(calls, maxsize=2)
+    f(1)
+    f(2)
+    f(1)
+    f(3)
+    f(1)
+    f(2)
+    assert calls == [1, 2, 3, 2]
+    assert f.cache_info().evictions == 2
+
+
+def test_cached_monadic_fifo():
+    calls = []
+    f = counting_invert(calls, maxsize=2, policy='fifo')
+    f(1)
+    f(2)
+    f(1)
+    f(3)
+    f(1)
+    assert calls == [1, 2, 3, 1]
+
+
+def test_cached_monadic_ttl():
+    calls = []
+    timer = FakeTimer()
+    f = counting_invert(calls, ttl=10, timer=timer)
+    f(1)
+    timer.now = 5
+    f(1)
+    timer.now = 10
+    f(1)
+    assert calls == [1, 1]
+
+
+def test_cached_monadic_invalidate():
+    calls = []
+    f = counting_invert(calls)
+    f(1)
+    assert f.invalidate(1)
+    assert not f.invalidate(1)
+    f(1)
+    assert calls == [1, 1]
+
+
+def test_cached_monadic_clear():
+    calls = []
+    f = counting_invert(calls)
+    f(1)
+    f.cache_clear()
+    assert f.cache_info() == maybe.CacheInfo(0, 0, 0, 128, 0)
+    f(1)
+    assert calls == [1, 1]
+
+
+def test_cached_monadic_policy():
+    with pytest.raises(ValueError):
+        maybe.cached_monadic(policy='random')
+
+
+def test_cached_monadic_threads():
+    f = maybe.cached_monadic(maxsize=10)(lambda a: a)
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(f, [i % 20 for i in range(1000)]))
+    assert results == [maybe.Just(i % 20) for i in range(1000)]
+    info = f.cache_info()
+    assert info.hits + info.misses == 1000
+    assert info.currsize <= 10
+
+
+def test_cached_monadic_wraps():
+    assert counting_invert([]).__name__ == 'f'
+
+
+def add3(a, b, c):
+    return a + b + c
+
+
+def test_lift():
+    got = maybe.lift(add3, maybe.Just(1), maybe.Just(2), maybe.Just(3))
+    assert got == maybe.Just(6)
+
+
+def test_lift_nothing():
+    got = maybe.lift(add3, maybe.Just(1), maybe.Nothing(), maybe.Just(3))
+    assert got is maybe.Nothing()
+
+
+def test_lift_matches_apply():
+    def curried(a):
+        return lambda b: lambda c: add3(a, b, c)
+    args = (maybe.Just(1), maybe.Just(2), maybe.Just(3))
+    assert maybe.lift(add3, *args) == \
+        maybe.Just(curried).apply(args[0]).apply(args[1]).apply(args[2])
+
+
+def test_lift_exception():
+    assert maybe.lift(lambda a, b: a / b,
+                      maybe.Just(1), maybe.Just(0)) is maybe.Nothing()
+
+
+def test_lift_none():
+    assert maybe.lift(lambda a: None, maybe.Just(1)) is maybe.Nothing()
+
+
+def test_lift_no_args():
+    assert maybe.lift(lambda: 1) == maybe.Just(1)
+
+
+def test_map_n():
+    got = maybe.map_n(
+        lambda a, b: a + b,
+        [maybe.Just(1), maybe.Nothing(), maybe.Just(3), maybe.Just(4)],
+        [maybe.Just(1), maybe.Just(2), maybe.Just(3)])
+    assert list(got) == [maybe.Just(2), maybe.Nothing(), maybe.Just(6)]
+
+
+def test_map_n_failure():
+    got = maybe.map_n(lambda a, b: a / b,
+                      [maybe.Just(1), maybe.Just(1)],
+                      [maybe.Just(0), maybe.Just(2)])
+    assert list(got) == [maybe.Nothing(), maybe.Just(0.5)]
+
+
+def test_traverse_into():
+    values = []
+    assert maybe.traverse_into(invert, [1, 2], values.append) == \
+        maybe.Just(2)
+    assert values == [1, 0.5]
+
+
+def test_traverse_into_nothing():
+    values = []
+    items = iter([1, 0, 2])
+    assert maybe.traverse_into(invert, items, values.append) is \
+        maybe.Nothing()
+    assert values == [1]
+    assert list(items) == [2]
+
+
+def test_sequence_into():
+    values = []
+    got = maybe.sequence_into(
+        (maybe.Just(i) for i in range(3)), values.append)
+    assert got == maybe.Just(3)
+    assert values == [0, 1, 2]
+
+
+def test_sequence_into_infinite():
+    maybes = itertools.chain([maybe.Just(1), maybe.Nothing()],
+                             itertools.repeat(maybe.Just(2)))
+    assert maybe.sequence_into(maybes, lambda v: None) is maybe.Nothing()
+
+
+def checked_add(acc, a):
+    if a < 0:
+        return maybe.Nothing()
+    return maybe.Just(acc + a)
+
+
+def test_fold_m():
+    assert maybe.fold_m(checked_add, 0, [1, 2, 3]) == maybe.Just(6)
+
+
+def test_fold_m_empty():
+    assert maybe.fold_m(checked_add, 0, []) == maybe.Just(0)
+
+
+def test_fold_m_nothing_stops():
+    items = itertools.chain([1, -1], itertools.count())
+    assert maybe.fold_m(checked_add, 0, items) is maybe.Nothing()
+
+
+def test_fold_m_long():
+    got = maybe.fold_m(lambda acc, a: maybe.Just(acc + a), 0, range(100000))
+    assert got == maybe.Just(sum(range(100000)))
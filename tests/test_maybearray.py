@@ -0,0 +1,157 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for MaybeArray."""
+
+import math
+
+import pytest
+
+import mir.monads.maybe as maybe
+
+numpy = pytest.importorskip('numpy')
+from mir.monads.maybearray import MaybeArray  # noqa: E402
+
+
+def invert(a):
+    return 1 / a
+
+
+def test_from_values():
+    assert MaybeArray.from_values([1, None, 2]).to_maybes() == [
+        maybe.Just(1), maybe.Nothing(), maybe.Just(2)]
+
+
+def test_from_values_nan():
+    array = MaybeArray.from_values([1.0, math.nan])
+    assert array.to_maybes() == [maybe.Just(1.0), maybe.Nothing()]
+
+
+def test_from_values_objects():
+    array = MaybeArray.from_values([(1, 2), None, (3,)])
+    assert array.to_maybes() == [
+        maybe.Just((1, 2)), maybe.Nothing(), maybe.Just((3,))]
+
+
+def test_from_maybes_round_trip():
+    maybes = [maybe.Just(1), maybe.Nothing(), maybe.Just(3)]
+    assert MaybeArray.from_maybes(maybes).to_maybes() == maybes
+
+
+@pytest.mark.parametrize('values', [
+    [1, 'a'],
+    [True, 2],
+    [1, 2.5],
+    [1.5, 'a', None],
+])
+def test_from_maybes_round_trip_mixed_types(values):
+    maybes = [maybe.Nothing() if value is None else maybe.Just(value)
+              for value in values]
+    got = MaybeArray.from_maybes(maybes).to_maybes()
+    assert got == maybes
+    assert [type(m) for m in got] == [type(m) for m in maybes]
+    assert [type(m.value) for m in got if m is not maybe.Nothing()] == \
+        [type(value) for value in values if value is not None]
+
+
+def test_from_values_same_type_not_object():
+    assert MaybeArray.from_values([1, 2]).values.dtype.kind == 'i'
+
+
+def test_getitem():
+    array = MaybeArray.from_values([1, None])
+    assert array[0] == maybe.Just(1)
+    assert type(array[0].value) is int
+    assert array[1] is maybe.Nothing()
+
+
+def test_mismatched_mask():
+    with pytest.raises(ValueError):
+        MaybeArray([1, 2], [True])
+
+
+@pytest.mark.parametrize('f', [
+    lambda x: x + 1,
+    invert,
+    lambda x: None,
+    lambda x: 1 + '',
+])
+def test_fmap_matches_just(f):
+    values = [0, 1, None, 2, 4]
+    array = MaybeArray.from_values(values)
+    expected = [maybe.Just(v).fmap(f) if v is not None else maybe.Nothing()
+                for v in values]
+    assert array.fmap(f).to_maybes() == expected
+
+
+def test_fmap_vectorized():
+    calls = []
+
+    def f(values):
+        calls.append(values)
+        return values * 2
+    array = MaybeArray.from_values([1, None, 3])
+    assert array.fmap(f).to_maybes() == [
+        maybe.Just(2), maybe.Nothing(), maybe.Just(6)]
+    assert len(calls) == 1
+
+
+def test_fmap_nan():
+    array = MaybeArray.from_values([1.0, 2.0]).fmap(
+        lambda x: numpy.where(x > 1, math.nan, x))
+    assert array.to_maybes() == [maybe.Just(1.0), maybe.Nothing()]
+
+
+def test_fmap_float_errors_vectorized():
+    calls = []
+
+    def f(values):
+        calls.append(values)
+        return 1 / values
+    array = MaybeArray.from_values([0.0, 2.0, None, 4.0]).fmap(f)
+    assert array.to_maybes() == [
+        maybe.Nothing(), maybe.Just(0.5),
+        maybe.Nothing(), maybe.Just(0.25)]
+    assert len(calls) == 1
+
+
+def test_fmap_keeps_infinity_without_errors():
+    array = MaybeArray.from_values([math.inf, 1.0]).fmap(lambda x: x * 2)
+    assert array.to_maybes() == [maybe.Just(math.inf), maybe.Just(2.0)]
+
+
+def test_fmap_log():
+    array = MaybeArray.from_values([0.0, 1.0, -1.0]).fmap(numpy.log)
+    assert array.to_maybes() == [
+        maybe.Nothing(), maybe.Just(0.0), maybe.Nothing()]
+
+
+def test_bind():
+    def f(values):
+        return MaybeArray(values * 10, values > 1)
+    array = MaybeArray.from_values([1, None, 2]).bind(f)
+    assert array.to_maybes() == [
+        maybe.Nothing(), maybe.Nothing(), maybe.Just(20)]
+
+
+def test_bind_wrong_length():
+    with pytest.raises(ValueError):
+        MaybeArray.from_values([1, 2]).bind(lambda x: MaybeArray([1]))
+
+
+def test_apply():
+    functions = MaybeArray.from_values([abs, None, str])
+    array = functions.apply(MaybeArray.from_values([-1, 2, None]))
+    assert array.to_maybes() == [
+        maybe.Just(1), maybe.Nothing(), maybe.Nothing()]
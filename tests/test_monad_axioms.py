@@ -16,7 +16,12 @@
 
 import pytest
 
+import mir.monads.either as either
+import mir.monads.id as id_
 import mir.monads.maybe as maybe
+from mir.monads.pipeline import IdentityPipeline
+from mir.monads.pipeline import MaybePipeline
+import mir.monads.writer as writer
 
 
 def add_one(a):
@@ -27,8 +32,18 @@ def times_two(a):
     return a * 2
 
 
+def logged_add_one(a):
+    return writer.writer(a + 1, 'add one')
+
+
+def logged_times_two(a):
+    return writer.writer(a * 2, 'times two')
+
+
 @pytest.mark.parametrize('unit,f,a', [
     (maybe.Just, maybe.monadic(add_one), 1),
+    (either.Right, either.monadic(add_one), 1),
+    (writer.writer, logged_add_one, 1),
 ])
 def test_bind_left_identity(unit, f, a):
     """return a >>= f ≡ f a
@@ -40,6 +55,9 @@ def test_bind_left_identity(unit, f, a):
 
 @pytest.mark.parametrize('m,unit', [
     (maybe.Just(1), maybe.Just),
+    (either.Right(1), either.Right),
+    (either.Left(1), either.Right),
+    (writer.writer(1, 'a'), writer.writer),
 ])
 def test_bind_right_identity(m, unit):
     """m >>= return ≡ m
@@ -51,6 +69,8 @@ def test_bind_right_identity(m, unit):
 
 @pytest.mark.parametrize('m,f,g', [
     (maybe.Just(1), maybe.monadic(add_one), maybe.monadic(times_two)),
+    (either.Right(1), either.monadic(add_one), either.monadic(times_two)),
+    (writer.writer(1, 'a'), logged_add_one, logged_times_two),
 ])
 def test_bind_associativity(m, f, g):
     r"""(m >>= f) >>= g ≡ m >>= (\x -> f x >>= g)
@@ -58,3 +78,42 @@ def test_bind_associativity(m, f, g):
     (f >=> g) >=> h ≡ f >=> (g >=> h)
     """
     assert m.bind(f).bind(g) == m.bind(lambda x: f(x).bind(g))
+
+
+def identity_add_one(a):
+    return id_.Identity(a + 1)
+
+
+def identity_times_two(a):
+    return id_.Identity(a * 2)
+
+
+_maybe_arrows = (maybe.monadic(add_one), lambda a: maybe.Just(a * 2),
+                 maybe.monadic(lambda a: 1 / a))
+_identity_arrows = (identity_add_one, identity_times_two, identity_add_one)
+
+
+@pytest.mark.parametrize('pipeline,unit,f,a', [
+    (MaybePipeline, maybe.Just, _maybe_arrows[0], 1),
+    (MaybePipeline, maybe.Just, _maybe_arrows[2], 0),
+    (IdentityPipeline, id_.Identity, identity_add_one, 1),
+])
+def test_kleisli_identity(pipeline, unit, f, a):
+    """return >=> g ≡ g ≡ g >=> return"""
+    assert pipeline.compose(unit, f)(a) == f(a)
+    assert pipeline.compose(f, unit)(a) == f(a)
+    assert pipeline.compose(pipeline(), f)(a) == f(a)
+
+
+@pytest.mark.parametrize('pipeline,f,g,h,a', [
+    (MaybePipeline,) + _maybe_arrows + (1,),
+    (MaybePipeline,) + _maybe_arrows + (-1,),
+    (MaybePipeline,) + _maybe_arrows[::-1] + (0,),
+    (IdentityPipeline,) + _identity_arrows + (1,),
+])
+def test_kleisli_associativity(pipeline, f, g, h, a):
+    """(f >=> g) >=> h ≡ f >=> (g >=> h)"""
+    left = pipeline.compose(pipeline.compose(f, g), h)
+    right = pipeline.compose(f, pipeline.compose(g, h))
+    assert left(a) == right(a)
+    assert left(a) == f(a).bind(g).bind(h)
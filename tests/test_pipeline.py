@@ -0,0 +1,142 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for fused pipelines."""
+
+import pytest
+
+from mir.monads.id import Identity
+import mir.monads.maybe as maybe
+from mir.monads.pipeline import IdentityPipeline
+from mir.monads.pipeline import MaybePipeline
+
+
+def add_one(a):
+    return a + 1
+
+
+@maybe.monadic
+def invert(a):
+    return 1 / a
+
+
+def test_identity_empty():
+    assert IdentityPipeline()(1) == Identity(1)
+
+
+def test_identity_fmap():
+    p = IdentityPipeline().fmap(add_one).fmap(str)
+    assert p(1) == Identity(1).fmap(add_one).fmap(str)
+
+
+def test_identity_bind():
+    p = IdentityPipeline().bind(lambda x: Identity(x + 1)).fmap(add_one)
+    assert p(1) == Identity(3)
+
+
+def test_identity_bind_last():
+    p = IdentityPipeline().fmap(add_one).bind(lambda x: Identity(x * 2))
+    assert p(1) == Identity(4)
+
+
+def test_identity_extend():
+    p = IdentityPipeline().fmap(add_one)
+    p.fmap(add_one)
+    assert p(1) == Identity(2)
+
+
+@pytest.mark.parametrize('value', [0, 1, 2, 'a'])
+def test_maybe_matches_methods(value):
+    p = MaybePipeline().fmap(add_one).bind(invert).fmap(add_one)
+    m = maybe.Just(value).fmap(add_one).bind(invert).fmap(add_one)
+    assert p(value) == m
+
+
+def test_maybe_fmap_none():
+    p = MaybePipeline().fmap(lambda x: None).fmap(add_one)
+    assert p(1) is maybe.Nothing()
+
+
+def test_maybe_fmap_exception():
+    assert MaybePipeline().fmap(lambda x: 1 + '')(1) is maybe.Nothing()
+
+
+def test_maybe_bind_nothing_short_circuits():
+    calls = []
+    p = MaybePipeline().bind(invert).fmap(calls.append)
+    assert p(0) is maybe.Nothing()
+    assert calls == []
+
+
+def test_maybe_bind_last():
+    assert MaybePipeline().fmap(add_one).bind(invert)(1) == maybe.Just(0.5)
+
+
+def test_run_many():
+    p = MaybePipeline().bind(invert)
+    assert list(p.run_many([1, 0, 2])) == [
+        maybe.Just(1.0), maybe.Nothing(), maybe.Just(0.5)]
+
+
+def test_compile_cached():
+    p = IdentityPipeline().fmap(add_one)
+    assert p.compile() is p.compile()
+
+
+def half(a):
+    return maybe.Just(a / 2)
+
+
+def test_maybe_compose():
+    p = MaybePipeline.compose(invert, half, invert)
+    for value in [0, 1, 4]:
+        assert p(value) == invert(value).bind(half).bind(invert)
+
+
+def test_maybe_compose_flattens():
+    inner = MaybePipeline.compose(half, invert)
+    p = MaybePipeline.compose(invert, inner, MaybePipeline.compose(half))
+    flat = MaybePipeline.compose(invert, half, invert, half)
+    assert p._stages == flat._stages
+
+
+def test_maybe_compose_fuses_monadic():
+    p = MaybePipeline.compose(invert, invert)
+    assert [method for method, f in p._stages] == ['fmap', 'fmap']
+    assert p(2) == maybe.Just(2.0)
+    assert p(0) is maybe.Nothing()
+
+
+def test_maybe_compose_monadic_none():
+    p = MaybePipeline.compose(maybe.monadic(lambda x: None), half)
+    assert p(1) is maybe.Nothing()
+
+
+def test_maybe_compose_cached_monadic():
+    f = maybe.cached_monadic()(lambda x: 1 / x)
+    p = MaybePipeline.compose(f, half)
+    assert p(2) == maybe.Just(0.25)
+    assert p(0) is maybe.Nothing()
+
+
+def test_maybe_compose_empty():
+    assert MaybePipeline.compose()(1) == maybe.Just(1)
+
+
+def test_identity_compose():
+    p = IdentityPipeline.compose(
+        lambda x: Identity(x + 1),
+        IdentityPipeline().fmap(add_one),
+        lambda x: Identity(x * 2))
+    assert p(1) == Identity(6)
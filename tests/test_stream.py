@@ -0,0 +1,127 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for lazy List monad."""
+
+import itertools
+
+import mir.monads.maybe as maybe
+import mir.monads.stream as stream
+from mir.monads.stream import Stream
+
+
+def results(m):
+    return list(m.iterable)
+
+
+def pair_with(x):
+    return Stream([(x, 'a'), (x, 'b')])
+
+
+def test_fmap():
+    assert results(Stream([1, 2]).fmap(lambda x: x + 1)) == [2, 3]
+
+
+def test_apply():
+    m = Stream([lambda x: x + 1, lambda x: x * 10]).apply(Stream([1, 2]))
+    assert results(m) == [2, 3, 10, 20]
+
+
+def test_bind():
+    assert results(Stream([1, 2]).bind(pair_with)) == [
+        (1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')]
+
+
+def test_bind_left_identity():
+    assert results(Stream([1]).bind(pair_with)) == results(pair_with(1))
+
+
+def test_bind_right_identity():
+    m = Stream([1, 2])
+    assert results(m.bind(lambda x: Stream([x]))) == results(m)
+
+
+def test_bind_associativity():
+    m = Stream([1, 2])
+
+    def g(x):
+        return Stream([x, x])
+    assert results(m.bind(pair_with).bind(g)) == \
+        results(m.bind(lambda x: pair_with(x).bind(g)))
+
+
+def test_reiterable():
+    m = Stream([1, 2]).bind(pair_with)
+    assert results(m) == results(m)
+
+
+def test_lazy():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return Stream([x])
+    m = Stream(itertools.count()).bind(f)
+    assert calls == []
+    assert results(m.take(3)) == [0, 1, 2]
+    assert calls == [0, 1, 2]
+
+
+def test_first():
+    assert Stream(itertools.count(5)).first() == maybe.Just(5)
+
+
+def test_first_empty():
+    assert Stream([]).first() is maybe.Nothing()
+
+
+def test_guard():
+    m = Stream(range(10)).bind(
+        lambda x: stream.guard(x % 3 == 0).fmap(lambda _: x))
+    assert results(m) == [0, 3, 6, 9]
+
+
+def test_plus():
+    assert results(Stream([1]).plus(Stream([2]))) == [1, 2]
+
+
+def test_interleave():
+    m = Stream([1, 2, 3]).interleave(Stream('ab'))
+    assert results(m) == [1, 'a', 2, 'b', 3]
+
+
+def test_interleave_infinite():
+    m = Stream(itertools.repeat(1)).interleave(Stream([2]))
+    assert results(m.take(3)) == [1, 2, 1]
+
+
+def test_fair_bind():
+    m = Stream([1, 2, 3]).fair_bind(lambda x: Stream([x] * x))
+    assert sorted(results(m)) == [1, 2, 2, 3, 3, 3]
+
+
+def test_fair_bind_infinite():
+    m = Stream(itertools.count()).fair_bind(
+        lambda x: Stream(itertools.count(x * 100)))
+    assert results(m.take(6)) == [0, 1, 100, 2, 101, 200]
+
+
+def test_search():
+    def triples(n):
+        return Stream(range(1, n)).bind(
+            lambda a: Stream(range(a, n)).bind(
+                lambda b: Stream(range(b, n)).bind(
+                    lambda c: stream.guard(a * a + b * b == c * c).fmap(
+                        lambda _: (a, b, c)))))
+    assert triples(100).first() == maybe.Just((3, 4, 5))
@@ -0,0 +1,138 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for tracing failures."""
+
+import pytest
+
+import mir.monads.maybe as maybe
+import mir.monads.pipeline as pipeline
+import mir.monads.trace as trace
+
+
+@pytest.fixture
+def tracing():
+    trace.clear()
+    trace.enable()
+    yield
+    trace.disable()
+    trace.clear()
+
+
+def invert(a):
+    return 1 / a
+
+
+def test_fmap_exception(tracing):
+    assert maybe.Just(0).fmap(invert) is maybe.Nothing()
+    assert trace.records() == [
+        trace.Record('invert', ZeroDivisionError, '0')]
+
+
+def test_fmap_none(tracing):
+    maybe.Just(1).fmap(lambda a: None)
+    assert trace.records() == [
+        trace.Record('test_fmap_none.<locals>.<lambda>', None, '1')]
+
+
+def test_monadic(tracing):
+    maybe.Just(1).fmap(invert).bind(maybe.monadic(invert)).bind(
+        lambda a: maybe.Just(a - 1)).bind(maybe.monadic(invert))
+    assert trace.records() == [
+        trace.Record('invert', ZeroDivisionError, '0.0')]
+
+
+def test_lift(tracing):
+    maybe.lift(divmod, maybe.Just(1), maybe.Just(0))
+    assert trace.records() == [
+        trace.Record('divmod', ZeroDivisionError, '(1, 0)')]
+
+
+def test_map_n(tracing):
+    list(maybe.map_n(divmod, [maybe.Just(1)], [maybe.Just(0)]))
+    assert trace.records() == [
+        trace.Record('divmod', ZeroDivisionError, '(1, 0)')]
+
+
+def test_success_not_recorded(tracing):
+    maybe.Just(1).fmap(invert).bind(maybe.monadic(invert))
+    assert trace.records() == []
+
+
+def test_nothing_not_recorded(tracing):
+    maybe.Nothing().fmap(invert)
+    assert trace.records() == []
+
+
+def test_repr_limit(tracing):
+    trace.enable(repr_limit=10)
+    maybe.Just('a' * 100).fmap(lambda a: None)
+    maybe.Just(list(range(100))).fmap(lambda a: None)
+    assert all(len(record.input) <= 10 for record in trace.records())
+
+
+def test_maxlen(tracing):
+    trace.enable(maxlen=2)
+    for i in range(5):
+        maybe.Just(i).fmap(lambda a: None)
+    assert [record.input for record in trace.records()] == ['3', '4']
+
+
+def test_rate_zero(tracing):
+    trace.enable(rate=0)
+    maybe.Just(0).fmap(invert)
+    assert trace.records() == []
+
+
+def test_rate_sampled(tracing):
+    trace.enable(rate=0.5, maxlen=10000)
+    for _ in range(1000):
+        maybe.Just(0).fmap(invert)
+    assert 300 < len(trace.records()) < 700
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        trace.enable(rate=2)
+
+
+def test_disable(tracing):
+    trace.disable()
+    maybe.Just(0).fmap(invert)
+    assert trace.records() == []
+
+
+def test_pipeline_exception(tracing):
+    run = pipeline.MaybePipeline().fmap(invert)
+    assert run(0) is maybe.Nothing()
+    assert trace.records() == [
+        trace.Record('invert', ZeroDivisionError, '0')]
+
+
+def test_pipeline_monadic_none(tracing):
+    def positive(a):
+        return a if a > 0 else None
+    run = pipeline.MaybePipeline.compose(maybe.monadic(invert),
+                                         maybe.monadic(positive))
+    assert run(-2) is maybe.Nothing()
+    assert trace.records() == [
+        trace.Record('test_pipeline_monadic_none.<locals>.positive', None,
+                     '-0.5')]
+
+
+def test_pipeline_not_tracing():
+    trace.clear()
+    run = pipeline.MaybePipeline().fmap(invert)
+    assert run(0) is maybe.Nothing()
+    assert trace.records() == []
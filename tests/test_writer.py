@@ -0,0 +1,109 @@
+# Copyright (C) 2016 Allen Li
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for Writer monad."""
+
+import pickle
+
+import mir.monads.writer as writer
+from mir.monads.writer import Log
+from mir.monads.writer import Writer
+
+
+@writer.logged
+def half(x):
+    return x // 2, 'halved %d' % x
+
+
+def test_fmap():
+    assert writer.writer(1, 'a').fmap(lambda x: x + 1) == \
+        writer.writer(2, 'a')
+
+
+def test_apply():
+    got = writer.writer(lambda x: x + 1, 'a').apply(writer.writer(1, 'b'))
+    assert got == writer.writer(2, 'a', 'b')
+
+
+def test_bind():
+    got = writer.writer(8).bind(half).bind(half)
+    assert got == writer.writer(2, 'halved 8', 'halved 4')
+
+
+def test_tell():
+    got = writer.tell('a', 'b').bind(lambda _: writer.writer(1, 'c'))
+    assert got == writer.writer(1, 'a', 'b', 'c')
+
+
+def test_fields():
+    m = writer.writer(1, 'a')
+    assert m.value == 1
+    assert list(m.log) == ['a']
+
+
+def test_long_chain():
+    m = writer.writer(0)
+    for _ in range(100000):
+        m = m.bind(lambda x: writer.writer(x + 1, x))
+    assert m.value == 100000
+    assert list(m.log) == list(range(100000))
+
+
+def test_right_nested_chain():
+    def count(n):
+        m = writer.writer(n, n)
+        for i in reversed(range(n)):
+            m = writer.tell(i).bind(lambda _, m=m: m)
+        return m
+    assert list(count(1000).log) == list(range(1001))
+
+
+def test_log_add_empty():
+    log = Log('ab')
+    assert log + Log() is log
+    assert Log() + log is log
+
+
+def test_log_len():
+    assert len(Log('ab') + Log('cd')) == 4
+
+
+def test_log_eq():
+    assert Log('ab') + Log('cd') == Log('abcd')
+    assert Log('ab') != Log('ba')
+
+
+def test_pickle():
+    m = writer.writer(1, 'a').bind(half)
+    assert pickle.loads(pickle.dumps(m)) == m
+
+
+def test_streaming():
+    entries = []
+    with writer.streaming(entries.append):
+        m = writer.writer(8).bind(half).bind(half)
+    assert m == Writer(2, Log())
+    assert entries == ['halved 8', 'halved 4']
+
+
+def test_streaming_restores():
+    outer = []
+    inner = []
+    with writer.streaming(outer.append):
+        with writer.streaming(inner.append):
+            writer.tell('a')
+        writer.tell('b')
+    assert writer.tell('c') == writer.writer(None, 'c')
+    assert inner == ['a']
+    assert outer == ['b']